@@ -0,0 +1 @@
+"""Shared tooling for the advent_of_code_2023 solutions."""
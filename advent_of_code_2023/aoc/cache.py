@@ -0,0 +1,115 @@
+"""Content-addressed on-disk cache for parsed inputs and answers.
+
+Entries are keyed by the SHA-256 of the input bytes together with the solver
+version, the digest of the sources that produced them, so editing a solution
+or the shared `aoc` package invalidates its entries on its own. Values are
+stored with `marshal` and the directory is kept under `max_bytes` by evicting
+the least recently used entries.
+
+Set `AOC_CACHE=0` in the environment (or pass `--no-cache` to the runner) to
+bypass the cache entirely.
+"""
+import hashlib
+import inspect
+import marshal
+import os
+from functools import cache
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+DIRECTORY = ROOT / ".cache"
+MAX_BYTES = 64 << 20
+MISSING = object()
+
+
+def enabled():
+    return os.environ.get("AOC_CACHE", "1") != "0"
+
+
+def digest(input_file):
+    # Hashed in chunks, so large inputs are never held in memory as a whole.
+    with open(input_file, "rb") as file:
+        return hashlib.file_digest(file, "sha256").hexdigest()
+
+
+@cache
+def solver_version(source_file):
+    """Digest of a solution's source and of every module of the `aoc` package."""
+    sha = hashlib.sha256()
+    for path in [Path(source_file), *sorted((ROOT / "aoc").glob("*.py"))]:
+        sha.update(path.read_bytes())
+    return sha.hexdigest()
+
+
+class Cache:
+    def __init__(self, directory=DIRECTORY, max_bytes=MAX_BYTES):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+
+    @staticmethod
+    def key(*parts):
+        return hashlib.sha256("\0".join(map(str, parts)).encode()).hexdigest()
+
+    def path(self, key):
+        return self.directory / f"{key}.marshal"
+
+    def get(self, key, default=None):
+        path = self.path(key)
+        try:
+            value = marshal.loads(path.read_bytes())
+        except (OSError, EOFError, ValueError, TypeError):
+            return default
+        # The modification time doubles as the last access time for eviction.
+        path.touch()
+        return value
+
+    def put(self, key, value):
+        try:
+            data = marshal.dumps(value)
+        except ValueError:
+            # Not every answer can be marshalled, those are simply not cached.
+            return
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self.path(key)
+        # Written aside and renamed, so concurrent readers never see half a file.
+        temporary = path.with_suffix(f".{os.getpid()}.tmp")
+        temporary.write_bytes(data)
+        os.replace(temporary, path)
+        self.evict()
+
+    def evict(self):
+        entries = []
+        for path in self.directory.glob("*.marshal"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+
+    def clear(self):
+        for path in self.directory.glob("*.marshal"):
+            path.unlink(missing_ok=True)
+
+
+def parsed(input_file, parse):
+    """Returns `parse(input_file)`, stored for identical inputs and parser sources.
+
+    The result has to be made of types `marshal` supports.
+    """
+    if not enabled():
+        return parse(input_file)
+
+    store = Cache()
+    key = store.key("parsed", digest(input_file), solver_version(inspect.getsourcefile(parse)), parse.__qualname__)
+    value = store.get(key, MISSING)
+    if value is MISSING:
+        value = parse(input_file)
+        store.put(key, value)
+    return value
@@ -0,0 +1,29 @@
+"""Seeded generators of valid puzzle inputs at any size.
+
+Every day has a module here with a `generate(seed, size, **options)` generator
+yielding the input as text chunks, newlines included. `size` is the number of
+records of the day (lines, games, hands, races, steps) or the height of its
+grid, and options tune the rest, e.g. `width` for grids. Nothing but the
+current record is kept in memory, so inputs of any size stream to disk:
+
+    python -m aoc.generators day_10 --size 100000 -o width=200 --output day_10/big.txt
+"""
+import importlib
+import sys
+
+
+def generator(day):
+    return importlib.import_module(f"{__name__}.{day}").generate
+
+
+def generate(day, size, seed=0, **options):
+    return generator(day)(seed, size, **options)
+
+
+def write(day, output, size, seed=0, **options):
+    """Streams the generated input of a day into `output`, a path or a stream."""
+    if output is None or output == "-":
+        sys.stdout.writelines(generate(day, size, seed, **options))
+        return
+    with open(output, "w", buffering=1 << 20) as file:
+        file.writelines(generate(day, size, seed, **options))
@@ -0,0 +1,27 @@
+import argparse
+import pkgutil
+
+from aoc import generators
+
+
+def option(text):
+    name, value = text.split("=", 1)
+    return name, int(value)
+
+
+def main(argv=None):
+    days = sorted(module.name for module in pkgutil.iter_modules(generators.__path__) if module.name.startswith("day_"))
+    parser = argparse.ArgumentParser(description=generators.__doc__.split("\n")[0])
+    parser.add_argument("day", choices=days)
+    parser.add_argument("--size", type=int, required=True, help="records, or grid rows, to generate")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("-o", "--option", dest="options", type=option, action="append", default=[],
+                        help="day specific integer option, e.g. width=200")
+    parser.add_argument("--output", default=None, help="file to write to (default: stdout)")
+    args = parser.parse_args(argv)
+
+    generators.write(args.day, args.output, args.size, args.seed, **dict(args.options))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,22 @@
+"""Calibration lines: letters with digits and spelled out digits mixed in."""
+import random
+from string import ascii_lowercase
+
+DIGITS = ["one", "two", "three", "four", "five", "six", "seven", "eight", "nine"]
+
+
+def generate(seed, size, length=12):
+    rng = random.Random(seed)
+    for _ in range(size):
+        pieces = [str(rng.randint(1, 9))]
+        while sum(map(len, pieces)) < length:
+            kind = rng.random()
+            if kind < 0.15:
+                pieces.append(str(rng.randint(1, 9)))
+            elif kind < 0.35:
+                pieces.append(rng.choice(DIGITS))
+            else:
+                pieces.append(rng.choice(ascii_lowercase))
+        # Part one needs a digit on every line, the one added first.
+        rng.shuffle(pieces)
+        yield "".join(pieces) + "\n"
@@ -0,0 +1,14 @@
+"""Games of cubes drawn from a bag, a few rounds each."""
+import random
+
+COLOURS = ("red", "green", "blue")
+
+
+def generate(seed, size, rounds=6, cubes=20):
+    rng = random.Random(seed)
+    for game in range(1, size + 1):
+        draws = []
+        for _ in range(rng.randint(1, rounds)):
+            colours = rng.sample(COLOURS, rng.randint(1, 3))
+            draws.append(", ".join(f"{rng.randint(1, cubes)} {colour}" for colour in colours))
+        yield f"Game {game}: {'; '.join(draws)}\n"
@@ -0,0 +1,20 @@
+"""Engine schematic: numbers and symbols scattered over a grid of dots."""
+import random
+
+SYMBOLS = "*#+$/=%@&-"
+
+
+def generate(seed, size, width=140):
+    rng = random.Random(seed)
+    for _ in range(size):
+        row = []
+        while len(row) < width:
+            kind = rng.random()
+            if kind < 0.1 and (not row or not row[-1].isdigit()):
+                row.extend(str(rng.randint(1, 999)))
+            elif kind < 0.14:
+                row.append(rng.choice(SYMBOLS))
+            else:
+                row.append(".")
+        # A number cut at the edge is still a number, it just ends early.
+        yield "".join(row[:width]) + "\n"
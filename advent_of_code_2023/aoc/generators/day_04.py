@@ -0,0 +1,18 @@
+"""Scratchcards with ten winning numbers and twenty five numbers each."""
+import random
+
+NUMBERS = range(1, 100)
+
+
+def generate(seed, size, winning=10, numbers=25):
+    rng = random.Random(seed)
+    width = len(str(size))
+    for card in range(1, size + 1):
+        # Copies never run past the end of the table.
+        matches = min(rng.randint(0, winning), size - card)
+        wins = rng.sample(NUMBERS, winning)
+        others = rng.sample([number for number in NUMBERS if number not in wins], numbers - matches)
+        have = rng.sample(wins, matches) + others
+        rng.shuffle(have)
+        yield (f"Card {card:>{width}}: {' '.join(f'{number:>2}' for number in wins)}"
+               f" | {' '.join(f'{number:>2}' for number in have)}\n")
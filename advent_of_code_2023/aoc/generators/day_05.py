@@ -0,0 +1,29 @@
+"""Almanac of seed ranges and seven maps shuffling `[0, magnitude)` around."""
+import random
+
+CATEGORIES = ("seed", "soil", "fertilizer", "water", "light", "temperature", "humidity", "location")
+
+
+def generate(seed, size, magnitude=1 << 32, rules=40):
+    """`size` seed ranges, each map splits the numbers into `rules` ranges."""
+    rng = random.Random(seed)
+    yield "seeds:"
+    for _ in range(size):
+        start = rng.randrange(magnitude)
+        yield f" {start} {rng.randint(1, (magnitude - start) // 8 + 1)}"
+    yield "\n"
+
+    for source, destination in zip(CATEGORIES, CATEGORIES[1:]):
+        yield f"\n{source}-to-{destination} map:\n"
+        cuts = [0, *sorted(rng.sample(range(1, magnitude), rules - 1)), magnitude]
+        lengths = [end - start for start, end in zip(cuts, cuts[1:])]
+        # Destination ranges are the same ranges in another order, some left unmapped.
+        order = list(range(rules))
+        rng.shuffle(order)
+        destinations, position = [0] * rules, 0
+        for index in order:
+            destinations[index] = position
+            position += lengths[index]
+        for start, length, target in zip(cuts, lengths, destinations):
+            if rng.random() < 0.9:
+                yield f"{target} {start} {length}\n"
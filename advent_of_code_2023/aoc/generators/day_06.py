@@ -0,0 +1,21 @@
+"""Race times and record distances, every race can be beaten."""
+import random
+
+
+def races(seed, size, magnitude):
+    rng = random.Random(seed)
+    for _ in range(size):
+        time = rng.randint(2, magnitude)
+        best = (time // 2) * (time - time // 2)
+        yield time, rng.randrange(best)
+
+
+def generate(seed, size, magnitude=100):
+    # Both lines list the same races, so they are drawn twice from the seed.
+    yield "Time:    "
+    for time, _ in races(seed, size, magnitude):
+        yield f" {time:>6}"
+    yield "\nDistance:"
+    for _, record in races(seed, size, magnitude):
+        yield f" {record:>6}"
+    yield "\n"
@@ -0,0 +1,12 @@
+"""Camel cards hands with their bids."""
+import random
+
+CARDS = "AKQJT98765432"
+
+
+def generate(seed, size, bid=1000):
+    rng = random.Random(seed)
+    for _ in range(size):
+        # Draws from a few cards make pairs and better hands more common.
+        cards = rng.sample(CARDS, rng.randint(1, 5))
+        yield f"{''.join(rng.choice(cards) for _ in range(5))} {rng.randint(1, bid)}\n"
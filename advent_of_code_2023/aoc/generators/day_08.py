@@ -0,0 +1,59 @@
+"""Network where every ghost walks a cycle through exactly one `Z` node.
+
+Ghost `k` leaves its `A` node into a chain of `length_k - 1` pairs of twin
+nodes, both twins pointing at the next pair in a random order, so the
+instructions pick a twin but never the position in the chain. The last pair
+leads to the ghost's `Z` node, which leads back to the first pair: every
+ghost is on a `Z` exactly every `length_k` steps. Like in the puzzle inputs,
+`length_k` is a multiple of the number of instructions, so a ghost only
+reaches its `Z` at the start of the instructions, once per cycle. Ghost 0
+walks from `AAA` to `ZZZ`, so part one has an answer too.
+"""
+import random
+
+# Chain nodes never end in A or Z.
+LETTERS = "BCDEFGHIJKLMNOPQRSTUVWXY"
+
+
+def label(number, width):
+    letters = []
+    for _ in range(width):
+        number, digit = divmod(number, len(LETTERS))
+        letters.append(LETTERS[digit])
+    return "".join(reversed(letters))
+
+
+def generate(seed, size, ghosts=6, instructions=263):
+    """`size` is the number of nodes, roughly."""
+    rng = random.Random(seed)
+    yield "".join(rng.choice("LR") for _ in range(instructions)) + "\n\n"
+
+    longest = max(1, size // (2 * ghosts * instructions))
+    # Pairs of twins in the chain of every ghost, drawn first to size the labels.
+    chains = [instructions * rng.randint(longest // 2 + 1, longest) - 1 for _ in range(ghosts)]
+    width = 3
+    while len(LETTERS) ** width < 2 * sum(chains) or len(LETTERS) ** (width - 1) < ghosts:
+        width += 1
+
+    counter = 0
+    for ghost, pairs in enumerate(chains):
+        if ghost == 0:
+            start, target = "AAA", "ZZZ"
+        else:
+            start, target = label(ghost, width - 1) + "A", label(ghost, width - 1) + "Z"
+
+        # Pair `i` of the chain is labelled `counter + 2 * i` and the number after it.
+        def pair(index):
+            if index == pairs:
+                return [target, target]
+            return [label(counter + 2 * index, width), label(counter + 2 * index + 1, width)]
+
+        first = pair(0)
+        yield f"{start} = ({first[0]}, {first[1]})\n"
+        for index in range(pairs):
+            following = pair(index + 1)
+            for node in pair(index):
+                rng.shuffle(following)
+                yield f"{node} = ({following[0]}, {following[1]})\n"
+        yield f"{target} = ({first[0]}, {first[1]})\n"
+        counter += 2 * pairs
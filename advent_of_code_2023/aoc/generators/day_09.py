@@ -0,0 +1,15 @@
+"""Histories sampled from random polynomials, so every one reduces to zeros."""
+import random
+
+
+def generate(seed, size, length=21, degree=10, coefficient=10):
+    rng = random.Random(seed)
+    for _ in range(size):
+        coefficients = [rng.randint(-coefficient, coefficient) for _ in range(rng.randint(0, degree) + 1)]
+        values = []
+        for x in range(length):
+            value = 0
+            for c in coefficients:
+                value = value * x + c
+            values.append(value)
+        yield " ".join(map(str, values)) + "\n"
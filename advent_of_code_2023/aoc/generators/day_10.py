@@ -0,0 +1,36 @@
+"""Pipe maze with a single loop through `S`, surrounded by stray pipes.
+
+The loop starts at `S` in the top left corner, runs right along the first
+row, down a staircase of random columns, back left along the last row and up
+the first column. Every row only depends on the column of the row before it.
+"""
+import random
+
+PIPES = "|-LJ7F."
+
+
+def generate(seed, size, width=140, steps=3):
+    """`size` is the number of rows, at least 2, and `width` at least 2."""
+    rng = random.Random(seed)
+    column = rng.randint(1, width - 1)
+
+    for y in range(size):
+        row = rng.choices(PIPES, k=width)
+        if y == 0:
+            row[0], row[column] = "S", "7"
+            row[1:column] = "-" * (column - 1)
+        elif y == size - 1:
+            row[0], row[column] = "L", "J"
+            row[1:column] = "-" * (column - 1)
+        else:
+            row[0] = "|"
+            previous, column = column, min(max(column + rng.randint(-steps, steps), 1), width - 1)
+            if column == previous:
+                row[column] = "|"
+            elif column > previous:
+                row[previous], row[column] = "L", "7"
+                row[previous + 1:column] = "-" * (column - previous - 1)
+            else:
+                row[previous], row[column] = "J", "F"
+                row[column + 1:previous] = "-" * (previous - column - 1)
+        yield "".join(row) + "\n"
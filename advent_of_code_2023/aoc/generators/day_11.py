@@ -0,0 +1,14 @@
+"""Galaxy image with some rows and columns left empty."""
+import random
+
+
+def generate(seed, size, width=140, density=0.02, empty=0.05):
+    rng = random.Random(seed)
+    columns = [x for x in range(width) if rng.random() >= empty]
+    for _ in range(size):
+        row = ["."] * width
+        if rng.random() >= empty:
+            for x in columns:
+                if rng.random() < density:
+                    row[x] = "#"
+        yield "".join(row) + "\n"
@@ -0,0 +1,14 @@
+"""Spring rows: a random arrangement with some of its springs hidden by `?`."""
+import random
+
+
+def generate(seed, size, length=20, unknown=0.5):
+    rng = random.Random(seed)
+    for _ in range(size):
+        springs = []
+        while not springs:
+            row = "".join(rng.choices(".#", k=rng.randint(1, length)))
+            springs = [len(group) for group in row.split(".") if group]
+        # Hiding a spring never removes the arrangement it came from.
+        masked = "".join("?" if rng.random() < unknown else char for char in row)
+        yield f"{masked} {','.join(map(str, springs))}\n"
@@ -0,0 +1,53 @@
+"""Patterns of ash and rocks with one mirror line and one smudged mirror line.
+
+Cells are drawn per orbit of the two mirrors, one across rows and one across
+columns, so the pattern is symmetric around both. Then a single cell in a
+row the row mirror doesn't reach is flipped: the row mirror stays perfect and
+the column mirror is off by exactly one smudge. Patterns with any other mirror
+line are drawn again.
+"""
+import random
+
+
+def mirror(line, length):
+    """Maps every index to the smallest index of its pair around `line`."""
+    return [min(i, 2 * line - 1 - i) if 0 <= 2 * line - 1 - i < length else i for i in range(length)]
+
+
+def differences(masks):
+    for line in range(1, len(masks)):
+        yield sum((masks[line - 1 - i] ^ masks[line + i]).bit_count() for i in range(min(line, len(masks) - line)))
+
+
+def unique_mirrors(pattern):
+    rows = [int(line.translate(str.maketrans("#.", "10")), 2) for line in pattern]
+    columns = [int("".join(column).translate(str.maketrans("#.", "10")), 2) for column in zip(*pattern)]
+    found = [*differences(rows), *differences(columns)]
+    return found.count(0) == 1 and found.count(1) == 1
+
+
+def draw(rng, height, width):
+    # An off-centre row mirror always leaves a row without a pair to smudge.
+    row_line = rng.choice([line for line in range(1, height) if 2 * line != height])
+    column_line = rng.randint(1, width - 1)
+    rows, columns = mirror(row_line, height), mirror(column_line, width)
+    orbits = {}
+    pattern = [[orbits.setdefault((y, x), rng.choice("#.")) for x in columns] for y in rows]
+
+    y = rng.choice([y for y in range(height) if rows[y] == y and not 0 <= 2 * row_line - 1 - y < height])
+    x = rng.choice([x for x in range(width) if 0 <= 2 * column_line - 1 - x < width])
+    pattern[y][x] = "." if pattern[y][x] == "#" else "#"
+    return ["".join(row) for row in pattern]
+
+
+def generate(seed, size, smallest=5, largest=17):
+    """`size` is the number of patterns."""
+    rng = random.Random(seed)
+    for index in range(size):
+        pattern = None
+        while pattern is None or not unique_mirrors(pattern):
+            pattern = draw(rng, rng.randint(smallest, largest), rng.randint(smallest, largest))
+        # Transposed half of the time, so the perfect mirror isn't always across rows.
+        if rng.random() < 0.5:
+            pattern = ["".join(column) for column in zip(*pattern)]
+        yield ("\n" if index else "") + "\n".join(pattern) + "\n"
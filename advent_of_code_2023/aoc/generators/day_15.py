@@ -0,0 +1,18 @@
+"""Initialization sequence of lens insertions and removals on one line."""
+import random
+from string import ascii_lowercase
+
+
+def generate(seed, size, labels=1000):
+    rng = random.Random(seed)
+    # A limited pool of labels, so lenses get replaced and removed.
+    pool = {"".join(rng.choices(ascii_lowercase, k=rng.randint(2, 6))) for _ in range(labels)}
+    pool = sorted(pool)
+    for step in range(size):
+        label = rng.choice(pool)
+        separator = "," if step else ""
+        if rng.random() < 0.3:
+            yield f"{separator}{label}-"
+        else:
+            yield f"{separator}{label}={rng.randint(1, 9)}"
+    yield "\n"
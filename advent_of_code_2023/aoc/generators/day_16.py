@@ -0,0 +1,9 @@
+"""Contraption grid of mirrors and splitters in empty space."""
+import random
+
+
+def generate(seed, size, width=110, density=0.1):
+    rng = random.Random(seed)
+    weights = (1 - density, *[density / 4] * 4)
+    for _ in range(size):
+        yield "".join(rng.choices(".\\/|-", weights, k=width)) + "\n"
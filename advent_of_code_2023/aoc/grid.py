@@ -0,0 +1,89 @@
+"""Character grid stored as one contiguous block of bytes.
+
+Cells are addressed either by `(x, y)` or by a flat index `y * stride + x`.
+When loaded from a file the raw bytes are used as is, newlines included, so a
+grid can be memory-mapped without copying it; `stride` then is `width + 1`.
+"""
+import mmap as mmap_module
+
+
+class Grid:
+    NEIGHBOURS = ((0, -1), (1, 0), (0, 1), (-1, 0))
+    DIAGONAL_NEIGHBOURS = NEIGHBOURS + ((1, -1), (1, 1), (-1, 1), (-1, -1))
+
+    def __init__(self, data, width, height, stride=None):
+        self.data = data
+        self.width = width
+        self.height = height
+        self.stride = stride or width
+
+    @classmethod
+    def from_lines(cls, lines):
+        lines = [line.rstrip("\n") for line in lines]
+        return cls(bytearray("".join(lines).encode()), len(lines[0]), len(lines))
+
+    @classmethod
+    def from_bytes(cls, data):
+        width = data.find(b"\n")
+        if width == -1:
+            return cls(data, len(data), 1)
+        stride = width + 1
+        # With CRLF line endings the "\r" is part of the stride, not a column.
+        if width and data[width - 1] == ord("\r"):
+            width -= 1
+        # The last row may or may not be followed by a line ending.
+        return cls(data, width, (len(data) + stride - width) // stride, stride)
+
+    @classmethod
+    def from_file(cls, input_file, mmap=False):
+        with open(input_file, "rb") as file:
+            if mmap:
+                return cls.from_bytes(mmap_module.mmap(file.fileno(), 0, access=mmap_module.ACCESS_READ))
+            return cls.from_bytes(file.read().strip())
+
+    def __getitem__(self, pos):
+        return chr(self.data[pos[1] * self.stride + pos[0]])
+
+    def __contains__(self, pos):
+        return 0 <= pos[0] < self.width and 0 <= pos[1] < self.height
+
+    def __len__(self):
+        return self.width * self.height
+
+    def in_bounds(self, x, y):
+        return 0 <= x < self.width and 0 <= y < self.height
+
+    def index(self, x, y):
+        return y * self.stride + x
+
+    def position(self, index):
+        y, x = divmod(index, self.stride)
+        return x, y
+
+    def neighbours(self, x, y, diagonal=False):
+        for dx, dy in self.DIAGONAL_NEIGHBOURS if diagonal else self.NEIGHBOURS:
+            nx, ny = x + dx, y + dy
+            if 0 <= nx < self.width and 0 <= ny < self.height:
+                yield nx, ny
+
+    def row(self, y):
+        start = y * self.stride
+        return bytes(self.data[start:start + self.width])
+
+    def column(self, x):
+        return bytes(self.data[x:self.height * self.stride:self.stride])
+
+    def rows(self):
+        for y in range(self.height):
+            yield self.row(y)
+
+    def find(self, char):
+        index = self.data.find(char.encode())
+        return None if index == -1 else self.position(index)
+
+    def find_all(self, char):
+        needle = char.encode()
+        index = self.data.find(needle)
+        while index != -1:
+            yield self.position(index)
+            index = self.data.find(needle, index + 1)
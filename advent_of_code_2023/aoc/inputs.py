@@ -0,0 +1,58 @@
+"""Streaming readers for puzzle inputs.
+
+Every reader is a generator that reads the file lazily and closes it once
+exhausted, so inputs much larger than memory are processed record by record.
+"""
+import mmap as mmap_module
+
+
+def lines(input_file, mmap=False):
+    """Yields the lines of a file without line endings, skipping blank ones."""
+    if mmap:
+        yield from mmap_lines(input_file)
+        return
+
+    with open(input_file, "r") as file:
+        for line in file:
+            line = line.rstrip("\r\n")
+            if line:
+                yield line
+
+
+def mmap_lines(input_file):
+    with open(input_file, "rb") as file:
+        with mmap_module.mmap(file.fileno(), 0, access=mmap_module.ACCESS_READ) as mapped:
+            for line in iter(mapped.readline, b""):
+                line = line.rstrip(b"\r\n")
+                if line:
+                    yield line.decode()
+
+
+def blocks(input_file):
+    """Yields groups of lines separated by blank lines, as lists."""
+    block = []
+    with open(input_file, "r") as file:
+        for line in file:
+            line = line.rstrip("\r\n")
+            if line:
+                block.append(line)
+            elif block:
+                yield block
+                block = []
+    if block:
+        yield block
+
+
+def tokens(input_file, separator=",", chunk_size=1 << 16):
+    """Yields `separator` separated tokens, reading the file in fixed size chunks."""
+    rest = ""
+    with open(input_file, "r") as file:
+        for chunk in iter(lambda: file.read(chunk_size), ""):
+            *complete, rest = (rest + chunk).split(separator)
+            for token in complete:
+                token = token.strip()
+                if token:
+                    yield token
+    rest = rest.strip()
+    if rest:
+        yield rest
@@ -0,0 +1,78 @@
+"""Opt-in timers and counters for the solutions.
+
+Nothing is recorded unless a `recording()` is active: `timer()` then returns a
+shared no-op context manager and `count()` returns straight away. Hot loops
+never call into this module per step, they keep their own totals and report
+them once, guarded by `enabled()`. See `aoc.profiler` to record a day.
+
+Counters from process pool workers (day 12 and day 16 `--workers`) stay in
+the workers and are not reported.
+"""
+import contextlib
+import time
+from collections import Counter, defaultdict
+
+recorder = None
+NO_TIMER = contextlib.nullcontext()
+
+
+class Recorder:
+    """Timers nested into `;` separated paths, and named counters."""
+
+    def __init__(self):
+        self.counters = Counter()
+        self.calls = Counter()
+        self.totals = defaultdict(float)
+        # Time spent in timers nested right under a path, to get its self time.
+        self.nested = defaultdict(float)
+        self.stack = []
+
+    @contextlib.contextmanager
+    def timer(self, name):
+        self.stack.append(name)
+        path = ";".join(self.stack)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            self.stack.pop()
+            self.calls[path] += 1
+            self.totals[path] += elapsed
+            if self.stack:
+                self.nested[";".join(self.stack)] += elapsed
+
+    def count(self, name, amount=1):
+        self.counters[name] += amount
+
+    def as_dict(self):
+        timers = {path: {"calls": self.calls[path], "total": total} for path, total in self.totals.items()}
+        return {"timers": timers, "counters": dict(self.counters)}
+
+    def collapsed(self):
+        """Self time of every timer path in microseconds, one folded stack per line."""
+        for path, total in self.totals.items():
+            yield f"{path} {round((total - self.nested[path]) * 1e6)}"
+
+
+def enabled():
+    return recorder is not None
+
+
+def timer(name):
+    return NO_TIMER if recorder is None else recorder.timer(name)
+
+
+def count(name, amount=1):
+    if recorder is not None:
+        recorder.count(name, amount)
+
+
+@contextlib.contextmanager
+def recording():
+    global recorder
+    previous, recorder = recorder, Recorder()
+    try:
+        yield recorder
+    finally:
+        recorder = previous
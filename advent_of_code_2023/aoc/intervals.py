@@ -0,0 +1,144 @@
+"""Sets of half-open integer intervals and piecewise shifts between them."""
+from bisect import bisect_right
+from functools import reduce
+from math import inf
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class IntervalSet:
+    """Sorted, merged, non-overlapping `[start, end)` intervals."""
+
+    def __init__(self, intervals=()):
+        self.intervals = self.merge(intervals)
+
+    @staticmethod
+    def merge(intervals):
+        merged = []
+        for start, end in sorted(intervals):
+            if start >= end:
+                continue
+            if merged and start <= merged[-1][1]:
+                merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+            else:
+                merged.append((start, end))
+        return merged
+
+    def __iter__(self):
+        return iter(self.intervals)
+
+    def __len__(self):
+        return len(self.intervals)
+
+    def __contains__(self, value):
+        index = bisect_right(self.intervals, (value, inf)) - 1
+        return index >= 0 and value < self.intervals[index][1]
+
+    def __eq__(self, other):
+        return isinstance(other, IntervalSet) and self.intervals == other.intervals
+
+    def __repr__(self):
+        return f"IntervalSet({self.intervals})"
+
+    def union(self, other):
+        return IntervalSet(self.intervals + other.intervals)
+
+    def size(self):
+        return sum(end - start for start, end in self.intervals)
+
+    def min(self):
+        return self.intervals[0][0]
+
+
+class RangeMap:
+    """A function shifting every integer by an offset that is constant per segment.
+
+    Segment `i` covers `[starts[i], starts[i + 1])` and maps `x` to
+    `x + offsets[i]`. The first segment starts at -inf and the last one runs to
+    +inf, so values outside every rule map to themselves.
+    """
+
+    def __init__(self, starts, offsets):
+        self.starts = starts
+        self.offsets = offsets
+        self._arrays = None
+
+    @classmethod
+    def identity(cls):
+        return cls([-inf], [0])
+
+    @classmethod
+    def from_rules(cls, rules):
+        """Builds the map from `(destination, source, length)` almanac rules."""
+        pieces = [(-inf, 0)]
+        for dest, src, rng in sorted(rules, key=lambda rule: rule[1]):
+            if pieces[-1][0] == src:
+                pieces.pop()
+            pieces.append((src, dest - src))
+            pieces.append((src + rng, 0))
+        return cls.from_pieces(pieces)
+
+    @classmethod
+    def from_pieces(cls, pieces):
+        starts, offsets = [], []
+        for start, offset in pieces:
+            if offsets and offsets[-1] == offset:
+                continue
+            starts.append(start)
+            offsets.append(offset)
+        return cls(starts, offsets)
+
+    @classmethod
+    def chain(cls, maps):
+        """Composes maps applied one after another into a single one."""
+        return reduce(cls.compose, maps, cls.identity())
+
+    def __call__(self, value):
+        return value + self.offsets[bisect_right(self.starts, value) - 1]
+
+    def __len__(self):
+        return len(self.starts)
+
+    def map_many(self, values):
+        """Maps a batch of values, vectorised when given a NumPy array."""
+        if np is not None and isinstance(values, np.ndarray):
+            starts, offsets = self.arrays()
+            return values + offsets[np.searchsorted(starts, values, side="right")]
+        return [self(value) for value in values]
+
+    def arrays(self):
+        """NumPy lookup tables, the -inf start is left out so they stay integer."""
+        if self._arrays is None:
+            self._arrays = (np.array(self.starts[1:], dtype=np.int64), np.array(self.offsets, dtype=np.int64))
+        return self._arrays
+
+    def segments(self):
+        ends = self.starts[1:] + [inf]
+        return zip(self.starts, ends, self.offsets)
+
+    def compose(self, other):
+        """Returns the map applying `self` first and `other` after it."""
+        pieces = []
+        for start, end, offset in self.segments():
+            # Walk the segments of `other` overlapping the image of this one.
+            index = bisect_right(other.starts, start + offset) - 1
+            while index < len(other.starts) and other.starts[index] < end + offset:
+                lower = max(start + offset, other.starts[index])
+                pieces.append((lower - offset, offset + other.offsets[index]))
+                index += 1
+        return RangeMap.from_pieces(pieces)
+
+    def image(self, intervals):
+        """Maps every interval through the function, splitting it at segment borders."""
+        images = []
+        for start, end in intervals:
+            index = bisect_right(self.starts, start) - 1
+            while start < end:
+                segment_end = self.starts[index + 1] if index + 1 < len(self.starts) else inf
+                stop = min(end, segment_end)
+                images.append((start + self.offsets[index], stop + self.offsets[index]))
+                start, index = stop, index + 1
+        return IntervalSet(images)
@@ -0,0 +1,66 @@
+"""Record the timers and counters of a single day.
+
+Parsing and every part are timed separately, each part on a freshly parsed
+input, and the report is either JSON or folded stacks for flamegraph tools.
+
+Usage (from the advent_of_code_2023 directory):
+
+    python -m aoc.profiler day_16                       # timers and counters as JSON
+    python -m aoc.profiler day_16 --format collapsed    # folded stacks for flamegraph.pl
+    python -m aoc.profiler day_16 --cprofile day_16.pstats
+"""
+import argparse
+import contextlib
+import cProfile
+import io
+import json
+import os
+import sys
+from pathlib import Path
+
+from aoc.instrument import recording, timer
+from aoc.runner import PARTS, ROOT, discover, load_solution, part_method
+
+
+def profile(day, parts=tuple(PARTS), input_name="input.txt", profiler=None):
+    solution_class, input_file = load_solution(day), ROOT / day / input_name
+    answers = {}
+
+    with recording() as record, timer(day), contextlib.redirect_stdout(io.StringIO()):
+        for part in parts:
+            with profiler or contextlib.nullcontext():
+                with timer("parse"):
+                    solution = solution_class(input_file)
+                with timer(part):
+                    answers[part] = part_method(solution, part)()
+
+    return answers, record
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("day", choices=discover())
+    parser.add_argument("--parts", nargs="+", choices=PARTS, default=list(PARTS))
+    parser.add_argument("--input", dest="input_name", default="input.txt", help="input file name inside the day")
+    parser.add_argument("--format", choices=("json", "collapsed"), default="json")
+    parser.add_argument("--cprofile", type=Path, help="also write cProfile stats to this file")
+    args = parser.parse_args(argv)
+
+    # Cached parses would time the cache instead of the parser.
+    os.environ.setdefault("AOC_CACHE", "0")
+    profiler = cProfile.Profile() if args.cprofile else None
+    answers, record = profile(args.day, args.parts, args.input_name, profiler)
+
+    if profiler:
+        profiler.dump_stats(args.cprofile)
+
+    if args.format == "json":
+        json.dump({"answers": answers, **record.as_dict()}, sys.stdout, indent=2, default=str)
+        sys.stdout.write("\n")
+    else:
+        for line in record.collapsed():
+            print(line)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+"""Run every 2023 solution from a single entry point.
+
+Each part runs in its own worker of a process pool, so the whole suite takes
+roughly as long as the slowest part. Results are reported with the answer,
+wall time and CPU time of every part.
+
+Usage (from the advent_of_code_2023 directory):
+
+    python -m aoc.runner                          # all days, JSON on stdout
+    python -m aoc.runner day_06 day_09 --format csv
+    python -m aoc.runner --workers 4 --output results.json
+    python -m aoc.runner --no-cache               # solve even if answers are cached
+"""
+import argparse
+import contextlib
+import csv
+import importlib
+import io
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from aoc import cache
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Days didn't settle on a single naming scheme, so each part has its aliases.
+PARTS = {
+    "part_one": ("part_one", "part_1", "run_part_one"),
+    "part_two": ("part_two", "part_2", "run_part_two"),
+}
+FIELDS = ("day", "part", "answer", "wall", "cpu", "cached", "error")
+
+
+def discover(root=ROOT, input_name="input.txt"):
+    """Days with a solution, and with an `input_name` input unless it is None."""
+    return sorted(
+        path.parent.name for path in root.glob("day_*/solution.py")
+        if input_name is None or (path.parent / input_name).exists()
+    )
+
+
+def load_solution(day):
+    if str(ROOT) not in sys.path:
+        sys.path.insert(0, str(ROOT))
+    return importlib.import_module(f"{day}.solution").Solution
+
+
+def part_method(solution, part):
+    for name in PARTS[part]:
+        if hasattr(solution, name):
+            return getattr(solution, name)
+    raise AttributeError(f"{type(solution).__name__} has no {part}")
+
+
+def run_part(day, part, input_name="input.txt"):
+    result = {"day": day, "part": part, "answer": None, "wall": 0.0, "cpu": 0.0, "cached": False, "error": None}
+    input_file = ROOT / day / input_name
+    wall, cpu = time.perf_counter(), time.process_time()
+
+    # Solutions print progress here and there, keep it out of the report.
+    with contextlib.redirect_stdout(io.StringIO()):
+        try:
+            store, key = None, None
+            if cache.enabled():
+                store = cache.Cache()
+                key = store.key("answer", cache.digest(input_file), cache.solver_version(ROOT / day / "solution.py"), part)
+                answer = store.get(key, cache.MISSING)
+                if answer is not cache.MISSING:
+                    result["answer"], result["cached"] = answer, True
+
+            if not result["cached"]:
+                solution = load_solution(day)(input_file)
+                result["answer"] = part_method(solution, part)()
+                if store is not None:
+                    store.put(key, result["answer"])
+        except Exception as error:
+            result["error"] = f"{type(error).__name__}: {error}"
+
+    result["wall"] = time.perf_counter() - wall
+    result["cpu"] = time.process_time() - cpu
+    return result
+
+
+def run(days, workers=None, input_name="input.txt"):
+    tasks = [(day, part) for day in days for part in PARTS]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(run_part, day, part, input_name) for day, part in tasks]
+        return [future.result() for future in futures]
+
+
+def write_json(results, wall, stream):
+    json.dump({"wall": wall, "results": results}, stream, indent=2, default=str)
+    stream.write("\n")
+
+
+def write_csv(results, wall, stream):
+    writer = csv.DictWriter(stream, fieldnames=FIELDS)
+    writer.writeheader()
+    writer.writerows(results)
+
+
+WRITERS = {"json": write_json, "csv": write_csv}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("days", nargs="*", help="days to run, e.g. day_06 (default: all)")
+    parser.add_argument("--workers", type=int, default=None, help="process pool size (default: CPU count)")
+    parser.add_argument("--format", choices=WRITERS, default="json")
+    parser.add_argument("--input", dest="input_name", default="input.txt", help="input file name inside each day")
+    parser.add_argument("--output", type=Path, default=None, help="write the report here instead of stdout")
+    parser.add_argument("--no-cache", action="store_true", help="ignore cached parsed inputs and answers")
+    args = parser.parse_args(argv)
+
+    if args.no_cache:
+        # Workers inherit the environment, so this reaches every solution too.
+        os.environ["AOC_CACHE"] = "0"
+
+    # Days without an input are left out, unless asked for by name.
+    days = args.days or discover(input_name=args.input_name)
+    unknown = sorted(set(days) - set(discover(input_name=None)))
+    if unknown:
+        parser.error(f"unknown days: {', '.join(unknown)}")
+
+    wall = time.perf_counter()
+    results = run(days, args.workers, args.input_name)
+    wall = time.perf_counter() - wall
+
+    with contextlib.ExitStack() as stack:
+        stream = stack.enter_context(open(args.output, "w", newline="")) if args.output else sys.stdout
+        WRITERS[args.format](results, wall, stream)
+
+    return 1 if any(result["error"] for result in results) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
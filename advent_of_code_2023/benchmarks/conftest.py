@@ -0,0 +1,64 @@
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from aoc.runner import ROOT
+from benchmarks.scaling import scale_input
+
+BASELINE = Path(__file__).with_name("baseline.json")
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("benchmarks")
+    group.addoption("--update-baseline", action="store_true", help="record this run as the new baseline")
+    group.addoption("--threshold", type=float, default=0.5, help="allowed growth of time and memory over the baseline, as a fraction")
+    group.addoption("--scales", default="1,10,100", help="comma separated input scales to run")
+
+
+def pytest_generate_tests(metafunc):
+    if "scale" in metafunc.fixturenames:
+        scales = [int(scale) for scale in metafunc.config.getoption("--scales").split(",")]
+        metafunc.parametrize("scale", scales, ids=lambda scale: f"x{scale}")
+
+
+def pytest_configure(config):
+    config.benchmark_results = {}
+    # Cached parses would time the cache instead of the solutions.
+    os.environ.setdefault("AOC_CACHE", "0")
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    if not config.benchmark_results:
+        return
+    terminalreporter.section("benchmarks")
+    for key, result in sorted(config.benchmark_results.items()):
+        terminalreporter.write_line(f"{key:<28} {result['wall']:>10.4f} s {result['peak'] / 2 ** 20:>10.2f} MiB")
+
+
+@pytest.fixture(scope="session")
+def baseline(request):
+    results = json.loads(BASELINE.read_text()) if BASELINE.exists() else {}
+    yield results
+    if request.config.getoption("--update-baseline"):
+        BASELINE.write_text(json.dumps(results, indent=2, sort_keys=True) + "\n")
+
+
+@pytest.fixture(scope="session")
+def scaled_inputs(tmp_path_factory):
+    paths = {}
+
+    def scaled_input(day, scale):
+        if (day, scale) not in paths:
+            input_file = ROOT / day / "input.txt"
+            # Inputs are personal, not every solved day has its own checked in.
+            text = scale_input(day, input_file.read_text(), scale) if input_file.exists() else None
+            if text is None or scale == 1:
+                paths[day, scale] = None if text is None else input_file
+            else:
+                paths[day, scale] = tmp_path_factory.mktemp(day) / f"input_x{scale}.txt"
+                paths[day, scale].write_text(text)
+        return paths[day, scale]
+
+    return scaled_input
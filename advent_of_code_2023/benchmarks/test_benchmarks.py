@@ -0,0 +1,73 @@
+"""Times every part of every day and compares it with the recorded baseline.
+
+    python -m pytest benchmarks                      # compare with baseline.json
+    python -m pytest benchmarks --update-baseline    # record a new baseline
+    python -m pytest benchmarks --scales 1,10 --threshold 0.25
+
+Baselines are only comparable on the machine they were recorded on.
+"""
+import time
+import tracemalloc
+
+import pytest
+
+from aoc.runner import PARTS, discover, load_solution, part_method
+
+# Absolute slack on top of the threshold, so tiny parts don't fail on noise.
+TIME_SLACK = 0.05
+MEMORY_SLACK = 1 << 20
+
+
+def measure(day, part, input_file):
+    solution = load_solution(day)
+
+    start = time.perf_counter()
+    answer = part_method(solution(input_file), part)()
+    wall = time.perf_counter() - start
+
+    # Tracing slows everything down, so memory is measured on a separate run.
+    tracemalloc.start()
+    try:
+        part_method(solution(input_file), part)()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    return {"answer": answer, "wall": wall, "peak": peak}
+
+
+@pytest.mark.parametrize("part", PARTS)
+@pytest.mark.parametrize("day", discover())
+def test_benchmark(day, part, scale, baseline, scaled_inputs, request):
+    input_file = scaled_inputs(day, scale)
+    if input_file is None:
+        pytest.skip(f"no input for {day} at x{scale}")
+
+    key = f"{day}/{part}/x{scale}"
+    result = measure(day, part, input_file)
+    request.config.benchmark_results[key] = result
+
+    if request.config.getoption("--update-baseline"):
+        baseline[key] = result
+        return
+
+    expected = baseline.get(key)
+    if expected is None:
+        pytest.skip(f"no baseline for {key}, record one with --update-baseline")
+
+    threshold = request.config.getoption("--threshold")
+    assert result["answer"] == expected["answer"]
+    assert result["wall"] <= expected["wall"] * (1 + threshold) + TIME_SLACK, f"{key} got slower"
+    assert result["peak"] <= expected["peak"] * (1 + threshold) + MEMORY_SLACK, f"{key} uses more memory"
+
+
+@pytest.mark.parametrize("half", [1, 10 ** 7, 10 ** 100])
+def test_day_06_race_without_winning_times(half):
+    # An odd race time whose record is the best possible distance: nothing wins,
+    # and the count must not step through the race to find that out.
+    solution = load_solution("day_06")
+
+    start = time.perf_counter()
+    assert solution.run_race(2 * half + 1, half * (half + 1)) == 0
+    assert solution.run_race(2 * half + 1, half * (half + 1) - 1) == 2
+    assert time.perf_counter() - start <= TIME_SLACK
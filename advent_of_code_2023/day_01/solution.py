@@ -1,25 +1,50 @@
-lines = open("input.txt", "r").read().strip().split("\n")
-
-s1 = 0
-s2 = 0
-vals = {'one': 1, 'two': 2, 'three': 3, 'four': 4, 'five': 5, 'six': 6, 'seven': 7, 'eight': 8, 'nine': 9}
-
-for line in lines:
-    digits_s1 = []
-    for element in line:
-        if element.isdigit():
-            digits_s1.append(int(element))
-
-    digits_s2 = []
-    for i,c in enumerate(line):
-        if c.isdigit():
-            digits_s2.append(int(c))
-        for val in vals:
-            if line[i:].startswith(val):
-                digits_s2.append(vals[val])
-
-    s1 += digits_s1[0] * 10 + digits_s1[-1]
-    s2 += digits_s2[0] * 10 + digits_s2[-1]
-
-print("Solution 1: ", s1)
-print("Solution 2: ", s2)
\ No newline at end of file
+import argparse
+import re
+import time
+from pathlib import Path
+
+from aoc.inputs import lines
+
+
+class Solution:
+    DIGITS = {'one': 1, 'two': 2, 'three': 3, 'four': 4, 'five': 5, 'six': 6, 'seven': 7, 'eight': 8, 'nine': 9}
+    VALUES = {**{str(i): i for i in range(10)}, **DIGITS, **{word[::-1]: value for word, value in DIGITS.items()}}
+
+    # Spelled digits can overlap ("oneight"), so the last one is found by
+    # searching the reversed line for the reversed words.
+    FIRST_DIGIT = LAST_DIGIT = re.compile(r"\d")
+    FIRST_WORD = re.compile("|".join([r"\d", *DIGITS]))
+    LAST_WORD = re.compile("|".join([r"\d", *(word[::-1] for word in DIGITS)]))
+
+    def __init__(self, input_file):
+        self.input_file = input_file
+        self.lines_read = 0
+
+    def part_one(self):
+        return self.calibrate(self.FIRST_DIGIT, self.LAST_DIGIT)
+
+    def part_two(self):
+        return self.calibrate(self.FIRST_WORD, self.LAST_WORD)
+
+    def calibrate(self, first, last):
+        solution = 0
+        for line in lines(self.input_file):
+            first_digit = self.VALUES[first.search(line).group()]
+            last_digit = self.VALUES[last.search(line[::-1]).group()]
+            solution += first_digit * 10 + last_digit
+            self.lines_read += 1
+
+        return solution
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("input_file", nargs="?", default=Path(__file__).with_name("input.txt"))
+    parser.add_argument("--throughput", action="store_true", help="report lines per second of every part")
+    args = parser.parse_args()
+
+    for name, part in (("Solution 1: ", Solution.part_one), ("Solution 2: ", Solution.part_two)):
+        solution, start = Solution(args.input_file), time.perf_counter()
+        print(name, part(solution))
+        if args.throughput:
+            print(f"{solution.lines_read / (time.perf_counter() - start):,.0f} lines/s")
@@ -1,54 +1,55 @@
 import re
+from array import array
+from itertools import compress
+from pathlib import Path
 
-lines = open("input.txt", "r").read().strip().split("\n")
+from aoc.inputs import lines
 
-cubes = { 'red': 12, 'green': 13, 'blue': 14 }
 
-games = []
+class Solution:
+    CUBES = {'red': 12, 'green': 13, 'blue': 14}
+    COLOURS = ('red', 'green', 'blue')
+    CUBE = re.compile(r'(\d+) (red|green|blue)')
 
-# Solution 1
-for line in lines:
-    valid = True
-    game = line.strip().split(": ")
-    game_num = int("".join(re.findall(r'\d+', game[0])))
-    game_sets = game[1].strip().split("; ")
+    def __init__(self, input_file):
+        # One column per field, the game at index i is ids[i] with the most
+        # cubes of each colour it ever showed in maxima[colour][i].
+        self.ids = array('I')
+        self.maxima = {colour: array('I') for colour in self.COLOURS}
 
-    for set in game_sets:
-        vals = { 'red': 0, 'green': 0, 'blue': 0 }
+        for line in lines(input_file):
+            self.parse_game(line)
 
-        set_inputs = set.strip().split(", ")
+    def part_one(self):
+        return self.possible_games(self.CUBES)
 
-        for set_input in set_inputs:
-            color = re.findall(r'[a-z]+', set_input)[0]
-            count = int("".join(re.findall(r'\d+', set_input)))
-            vals[color] += count
+    def part_two(self):
+        red, green, blue = (self.maxima[colour] for colour in self.COLOURS)
+        return sum(r * g * b for r, g, b in zip(red, green, blue))
 
-        if vals['red'] > cubes['red'] or vals['green'] > cubes['green'] or vals['blue'] > cubes['blue']:
-            valid = False
+    def possible_games(self, cubes):
+        """Sums ids of the games possible with the given cubes, the log is parsed once for any number of calls."""
+        red, green, blue = (self.maxima[colour] for colour in self.COLOURS)
+        possible = (
+            r <= cubes['red'] and g <= cubes['green'] and b <= cubes['blue']
+            for r, g, b in zip(red, green, blue)
+        )
+        return sum(compress(self.ids, possible))
 
-    if valid:
-        games.append(game_num)
+    def parse_game(self, line):
+        game, sets = line.split(": ", 1)
+        maxima = dict.fromkeys(self.COLOURS, 0)
 
-print("Solution 1: ", sum(games))
+        for count, colour in self.CUBE.findall(sets):
+            if int(count) > maxima[colour]:
+                maxima[colour] = int(count)
 
-counter = 0
-# Solution 2
-for line in lines:
-    vals = { 'red': 0, 'green': 0, 'blue': 0 }
-    game = line.strip().split(": ")
-    game_sets = game[1].strip().split("; ")
+        self.ids.append(int(game.split(" ")[1]))
+        for colour in self.COLOURS:
+            self.maxima[colour].append(maxima[colour])
 
-    for set in game_sets:
-        set_inputs = set.strip().split(", ")
 
-        for set_input in set_inputs:
-            color = re.findall(r'[a-z]+', set_input)[0]
-            count = int("".join(re.findall(r'\d+', set_input)))
-
-            if vals[color] < count:
-                vals[color] = count
-
-    game_counter = vals['red'] * vals['green'] * vals['blue']
-    counter += game_counter
-
-print("Solution 2: ", counter)
\ No newline at end of file
+if __name__ == "__main__":
+    input_file = Path(__file__).with_name("input.txt")
+    print("Solution 1: ", Solution(input_file).part_one())
+    print("Solution 2: ", Solution(input_file).part_two())
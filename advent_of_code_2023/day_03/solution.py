@@ -1,56 +1,88 @@
 import re
 from collections import defaultdict
+from pathlib import Path
 
-lines = open("input.txt", "r").read().strip().split("\n")
-
-solution_one = 0
-matrix = {}
-
-# Build matrix with coordinates, so we can use them later.
-# It's not most efficient way, but it works and it's easy to understand.
-for row_idx, row in enumerate(lines):
-    for col_idx, col in enumerate(row.strip()):
-        matrix[(col_idx, row_idx)] = col
-
-max_y = len(lines[0]) - 1
-max_x = len(lines) - 1
-
-# Solution 1
-for row_idx, row in enumerate(lines):
-    # Number returns a match object with idx of an element
-    for number in re.finditer(r"\d+", row):
-        result = False
-        x = range(max(number.start() - 1, 0), min(number.end() + 1, max_x))
-        y = range(max(row_idx - 1, 0), min(row_idx + 2, max_y))
-
-        for i in x:
-            for j in list(y):
-                value = matrix[(i, j)]
-                if not value.isdigit() and value != ".":
-                    result = True
-
-        if result:
-            solution_one += int(number.group())
-
-# Solution 2
-solution_two = 0
-gears = defaultdict(set)
-
-for row_idx, row in enumerate(lines):
-    # Number returns a match object with idx of an element
-    for number in re.finditer(r"\d+", row):
-        x = range(max(number.start() - 1, 0), min(number.end() + 1, max_x))
-        y = range(max(row_idx - 1, 0), min(row_idx + 2, max_y))
-
-        for i in x:
-            for j in list(y):
-                value = matrix[(i, j)]
-                if value == "*":
-                    gears[(i, j)].add(int(number.group()))
-
-for nums in gears.values():
-    if len(nums) == 2:
-        solution_two += nums.pop() * nums.pop()
-
-print("Solution 1: ", solution_one)
-print("Solution 2: ", solution_two)
+from aoc.inputs import lines
+
+
+class Solution:
+    NUMBER = re.compile(r"\d+")
+    SYMBOL = re.compile(r"[^\d.]")
+    NOT_GEAR = re.compile(r"[^*]")
+    SYMBOL_BITS = str.maketrans("0123456789.#", "000000000001")
+
+    def __init__(self, input_file):
+        self.input_file = input_file
+
+    def part_one(self):
+        return self.scan()[0]
+
+    def part_two(self):
+        return self.scan()[1]
+
+    def scan(self):
+        """Sweeps the schematic once, returning the part number sum and the gear ratio sum.
+
+        Every row is turned into two bitmasks, with bit x set when column x holds
+        a symbol, or a gear. Only three rows are kept at a time, and a number is
+        adjacent to a symbol when its span, widened by one, ANDs with a mask.
+        """
+        part_numbers, gear_ratios = 0, 0
+        gears = defaultdict(lambda: defaultdict(list))
+        empty = ("", 0, 0)
+        above, current = empty, empty
+
+        for y, row in enumerate(lines(self.input_file)):
+            below = (row, self.symbol_mask(row), self.gear_mask(row))
+            part_numbers += self.scan_row(y - 1, above, current, below, gears)
+            gear_ratios += self.gear_ratios(gears.pop(y - 2, {}))
+            above, current = current, below
+
+        part_numbers += self.scan_row(y, above, current, empty, gears)
+        for row_gears in gears.values():
+            gear_ratios += self.gear_ratios(row_gears)
+
+        return part_numbers, gear_ratios
+
+    def scan_row(self, y, above, current, below, gears):
+        part_numbers = 0
+        symbols = above[1] | current[1] | below[1]
+
+        for number in self.NUMBER.finditer(current[0]):
+            value, start = int(number.group()), max(number.start() - 1, 0)
+            span = ((1 << (number.end() + 1 - start)) - 1) << start
+
+            if span & symbols:
+                part_numbers += value
+
+            for gear_y, (_, _, row_gears) in enumerate((above, current, below), start=y - 1):
+                hits = span & row_gears
+                while hits:
+                    bit = hits & -hits
+                    gears[gear_y][bit.bit_length() - 1].append(value)
+                    hits ^= bit
+
+        return part_numbers
+
+    @staticmethod
+    def gear_ratios(row_gears):
+        return sum(numbers[0] * numbers[1] for numbers in row_gears.values() if len(numbers) == 2)
+
+    @classmethod
+    def symbol_mask(cls, row):
+        return cls.to_mask(cls.SYMBOL.sub("#", row).translate(cls.SYMBOL_BITS))
+
+    @classmethod
+    def gear_mask(cls, row):
+        return cls.to_mask(cls.NOT_GEAR.sub("0", row).replace("*", "1"))
+
+    @staticmethod
+    def to_mask(bits):
+        # Column x becomes bit x, so the string is read right to left.
+        return int(bits[::-1], 2)
+
+
+if __name__ == "__main__":
+    input_file = Path(__file__).with_name("input.txt")
+    print("Solution 1: ", Solution(input_file).part_one())
+    print("Solution 2: ", Solution(input_file).part_two())
@@ -1,40 +1,55 @@
-import re
-from collections import defaultdict
+from collections import deque
+from pathlib import Path
 
-lines = open("input.txt", "r").read().strip().split("\n")
+from aoc.inputs import lines
 
-# Solution 1
-solution_one = 0
 
-for line in lines:
-    [card, vals] = line.split(": ")
-    [winning, input] = vals.split(" | ")
+class Solution:
+    def __init__(self, input_file):
+        self.input_file = input_file
 
-    card_val = -1
-    for i in re.findall(r"\d+", input):
-        if i in re.findall(r"\d+", winning):
-            card_val += 1
+    def part_one(self):
+        return self.scan()[0]
 
-    if card_val >= 0:
-        solution_one += pow(2, card_val)
+    def part_two(self):
+        return self.scan()[1]
 
-print("Solution 1: ", solution_one)
+    def scan(self):
+        """Goes through the deck once, returning the points and the number of cards.
 
-# Solution 2
-cards = defaultdict(lambda: 0)
+        Copies won by a card always go to the cards right after it, so they are
+        kept as a difference array that slides along with the deck: `pending[k]`
+        is how many copies the k-th next card gains over the current one.
+        """
+        points, cards = 0, 0
+        copies, pending = 1, deque()
 
-for line in lines:
-    [card, vals] = line.split(": ")
-    [winning, input] = vals.split(" | ")
-    card_num = int(re.findall(r"\d+", card)[0])
+        for line in lines(self.input_file):
+            matches = self.matches(line)
+            if matches:
+                points += 1 << (matches - 1)
 
-    cards[card_num] += 1
-    card_power = card_num
+            cards += copies
+            while len(pending) <= matches:
+                pending.append(0)
+            # Every one of the next `matches` cards wins `copies` more copies.
+            pending[0] += copies
+            pending[matches] -= copies
 
-    for i in re.findall(r"\d+", input):
-        if i in re.findall(r"\d+", winning):
-            card_power += 1
-            cards[card_power] += cards[card_num]
+            copies += pending.popleft()
 
-solution_two = sum(cards.values())
-print("Solution 2: ", solution_two)
\ No newline at end of file
+        return points, cards
+
+    @staticmethod
+    def matches(line):
+        # Numbers are below 100, so each side fits in one int as a bitmask.
+        winning, numbers = line.split(": ")[1].split(" | ")
+        winning_mask = sum(1 << int(number) for number in winning.split())
+        numbers_mask = sum(1 << int(number) for number in numbers.split())
+        return (winning_mask & numbers_mask).bit_count()
+
+
+if __name__ == "__main__":
+    input_file = Path(__file__).with_name("input.txt")
+    print("Solution 1: ", Solution(input_file).part_one())
+    print("Solution 2: ", Solution(input_file).part_two())
@@ -1,64 +1,47 @@
 from itertools import islice
+from pathlib import Path
+
+from aoc.cache import parsed
+from aoc.inputs import blocks
+from aoc.intervals import IntervalSet, RangeMap
 
-seeds_data = open("input.txt", "r").read().strip().split("\n\n")
-maps = []
 
 class Solution:
-    def __init__(self):
-        self.seeds_data = open("input.txt", "r").read().strip().split("\n\n")
-        self.maps = self.build_maps(seeds_data[1:])
+    def __init__(self, input_file):
+        self.seeds, starts, offsets = parsed(input_file, self.parse)
+        self.almanac = RangeMap(starts, offsets)
 
     def run_part_one(self):
-        seeds_one = map(int, self.seeds_data[0].split(": ")[1].split(" "))
-        return self.apply_transforms(seeds_one,[])
+        return min(self.map_seeds(self.seeds))
 
     def run_part_two(self):
-        ranges = []
-        results = []
-        seeds_list = self.seeds_data[0].split(": ")[1].split(" ")
-        seeds_chunks = self.chunk(seeds_list, 2)
-        [ranges.append(range(int(s), int(s) + int(r))) for s, r in seeds_chunks]
-        [results.append(self.apply_range_transforms(r)) for r in ranges]
-
-        return self.flatten(results)
-
+        seeds_chunks = self.chunk(self.seeds, 2)
+        seed_ranges = IntervalSet((s, s + r) for s, r in seeds_chunks)
 
-    def apply_transforms(self, init_seeds, acc):
-        for seed in init_seeds:
-            for map in self.maps:
-                for dest, src, rng in map:
-                    if seed in range(src, src + rng):
-                        seed = dest + seed - src
-                        break
-            acc.append(seed)
+        return self.almanac.image(seed_ranges).min()
 
-        return acc
 
-    def apply_range_transforms(self, seed_range):
-        for map in self.maps:
-            for dest, src, rng in map:
-                s = []
-                src_end = src + rng
-                before = (seed_range.start(), min(seed_range.end(), src))
-                inter = (max(seed_range.start(), src), min(src_end, seed_range.end()))
-                after = (max(src_end, seed_range.start()), seed_range.end())
+    def map_seeds(self, seeds):
+        """Maps seeds to locations, pass a NumPy array to map them all at once."""
+        return self.almanac.map_many(seeds)
 
-                if before[1] > before[0]:
-                    s.append(before)
-                if inter[1] > inter[0]:
-                    s.append((inter[0]-src+dest, inter[1]-src+dest))
-                if after[1] > after[0]:
-                    s.append(after)
+    @staticmethod
+    def parse(input_file):
+        """Returns the seeds and the segments of the composed almanac."""
+        (seeds,), *maps_data = blocks(input_file)
+        seeds = [int(seed) for seed in seeds.split(": ")[1].split(" ")]
+        maps = Solution.build_maps(maps_data)
+        almanac = RangeMap.chain(RangeMap.from_rules(map) for map in maps)
+        return seeds, almanac.starts, almanac.offsets
 
-        return s
-
-    def build_maps(self, maps_data):
+    @staticmethod
+    def build_maps(maps_data):
         init_maps = []
         for map_data in maps_data:
             transforms = []
-            for n in map_data.split(" map:\n")[1:]:
-                for line in n.split("\n"):
-                    transforms.append(list(map(int, line.split(" "))))
+            # The first line is the map name.
+            for line in map_data[1:]:
+                transforms.append(list(map(int, line.split(" "))))
             init_maps.append(transforms)
 
         return init_maps
@@ -67,18 +50,8 @@ class Solution:
         list = iter(list)
         return iter(lambda: tuple(islice(list, size)), ())
 
-    def flatten(self, list):
-        flat_list = []
-        for sublist in list:
-            for item in sublist:
-                flat_list.append(item)
-
-        return flat_list
-
-s1 = Solution()
-result = s1.run_part_one()
-print("Solution 1: ", min(result))
 
-s2 = Solution()
-result = s2.run_part_two()
-print("Solution 2: ", min(result))
\ No newline at end of file
+if __name__ == "__main__":
+    input_file = Path(__file__).with_name("input.txt")
+    print("Solution 1: ", Solution(input_file).run_part_one())
+    print("Solution 2: ", Solution(input_file).run_part_two())
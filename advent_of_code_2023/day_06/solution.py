@@ -1,18 +1,20 @@
 import re
+from math import isqrt
+from pathlib import Path
+
+from aoc.inputs import lines
+
+
 class Solution:
-    def __init__(self):
-        times, records = open("input.txt", "r").read().strip().split("\n")
+    def __init__(self, input_file):
+        times, records = lines(input_file)
         times = map(int, re.findall(r"\d+", times))
         records = map(int, re.findall(r"\d+", records))
         self.races = list(zip(times, records))
 
     def run_part_one(self):
         result = 1
-        for time, record in self.races:
-            left = self.run_race(time, record, range(1, time, 1))
-            right = self.run_race(time, record, range(time, 0, -1))
-
-            combinations = right - left + 1
+        for combinations in self.run_races(self.races):
             result *= combinations
 
         return result
@@ -28,23 +30,36 @@ class Solution:
         time = int("".join(times))
         record = int("".join(distances))
 
-        left = self.run_race(time, record, range(1, time, 1))
-        right = self.run_race(time, record, range(time, 0, -1))
+        return self.run_race(time, record)
 
-        return right - left + 1
+    @staticmethod
+    def run_races(races):
+        return [Solution.run_race(time, record) for time, record in races]
 
-    def run_race(self, race_time, race_record, rage_range):
-        acc = 0
-        for warmup_time in rage_range:
-            time_left = race_time - warmup_time
-            if time_left * warmup_time > race_record:
-                acc = warmup_time
-                break
+    @staticmethod
+    def run_race(race_time, race_record):
+        """Counts warm-up times `t` with `t * (race_time - t) > race_record`.
 
-        return acc
+        Those lie strictly between the roots of `t^2 - race_time * t + race_record`.
+        The distance peaks at the half of the race, so if that time doesn't win
+        none does. Otherwise the square root is taken with `isqrt`, which puts
+        the estimate of the first winning time at most one step before it.
+        """
+        half = race_time // 2
+        if half * (race_time - half) <= race_record:
+            return 0
 
+        delta = race_time * race_time - 4 * race_record
+        left = max((race_time - isqrt(delta)) // 2, 0)
+        if left * (race_time - left) <= race_record:
+            left += 1
 
+        # Distances are symmetric around the half of the race.
+        right = race_time - left
+        return right - left + 1
 
 
-print("Solution one: ", Solution().run_part_one())
-print("Solution two: ", Solution().run_part_two())
\ No newline at end of file
+if __name__ == "__main__":
+    input_file = Path(__file__).with_name("input.txt")
+    print("Solution one: ", Solution(input_file).run_part_one())
+    print("Solution two: ", Solution(input_file).run_part_two())
@@ -1,16 +1,69 @@
 # To Read
 # https://en.wikipedia.org/wiki/Entropy_(information_theory)
 # https://pl.wikipedia.org/wiki/Entropia_(teoria_informacji)
+from pathlib import Path
 
-def eval(line):
-    hand, bid = line.split()
-    hand = hand.translate(str.maketrans('TJQKA', face))
-    best = max(type(hand.replace('0', r)) for r in hand)
-    return best, hand, int(bid)
+from aoc.inputs import lines
 
-def type(hand):
-    return sorted(map(hand.count, hand), reverse=True)
 
-for face in 'ABCDE', 'A0CDE':
-    print(sum(rank * bid for rank, (*_, bid) in
-              enumerate(sorted(map(eval, open('input.txt'))), start=1)))
\ No newline at end of file
+class Solution:
+    CARDS = '23456789TJQKA'
+    JOKER_CARDS = 'J23456789TQKA'
+    # Hand types by their two highest card counts, from high card up to five of a kind.
+    TYPES = {(1, 1): 0, (2, 1): 1, (2, 2): 2, (3, 1): 3, (3, 2): 4, (4, 1): 5, (5, 0): 6}
+    JOKER = ord('0')
+    BID_BITS = 32
+
+    def __init__(self, input_file):
+        self.input_file = input_file
+        # Card counts indexed by the rank digit, reset after every hand.
+        self.counts = bytearray(128)
+
+    def part_one(self):
+        return self.winnings(self.CARDS)
+
+    def part_two(self):
+        return self.winnings(self.JOKER_CARDS, jokers=True)
+
+    def winnings(self, cards, jokers=False):
+        ranks = str.maketrans(cards, '0123456789abc')
+        keys = sorted(self.eval(line, ranks, jokers) for line in lines(self.input_file))
+        bid_mask = (1 << self.BID_BITS) - 1
+        return sum(rank * (key & bid_mask) for rank, key in enumerate(keys, start=1))
+
+    def eval(self, line, ranks, jokers):
+        """Packs a hand into one int key: its type, its five ranks as hex digits, then its bid."""
+        hand, bid = line.split()
+        bid = int(bid)
+        # Negative bids shift to -1 as well, either would spill into the hand.
+        if bid >> self.BID_BITS:
+            raise ValueError(f"bid {bid} does not fit in {self.BID_BITS} bits")
+        hand = hand.translate(ranks)
+        return (self.type(hand.encode(), jokers) << 20 | int(hand, 16)) << self.BID_BITS | bid
+
+    def type(self, hand, jokers):
+        counts = self.counts
+        for card in hand:
+            counts[card] += 1
+
+        joker_count = 0
+        if jokers:
+            joker_count, counts[self.JOKER] = counts[self.JOKER], 0
+
+        # Each card is counted once, as its count is cleared on the first visit.
+        first, second = 0, 0
+        for card in hand:
+            count, counts[card] = counts[card], 0
+            if count > first:
+                first, second = count, first
+            elif count > second:
+                second = count
+
+        # Jokers are always best spent on the most common card.
+        return self.TYPES[first + joker_count, second]
+
+
+if __name__ == "__main__":
+    input_file = Path(__file__).with_name("input.txt")
+    print(Solution(input_file).part_one())
+    print(Solution(input_file).part_two())
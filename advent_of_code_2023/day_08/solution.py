@@ -1,46 +1,138 @@
 import re
-from math import lcm
+from collections import namedtuple
+from math import gcd
+from pathlib import Path
+
+from aoc.cache import parsed
+from aoc.inputs import blocks
+
+# Steps at which a walk stands on a target node: `hits` before the walk enters
+# its cycle at step `offset`, and `cycle_hits` which repeat every `period` steps.
+Cycle = namedtuple("Cycle", ["offset", "period", "hits", "cycle_hits"])
+
+
+class Network:
+    """The node map compiled to integer ids and walked a whole instruction pass at a time.
+
+    `ends[node]` is the node a full pass over the instructions ends on when
+    started from `node`, and `hits[node]` the steps of that pass landing on a
+    target. Walks then only need to be followed pass by pass.
+    """
+
+    def __init__(self, route_map, nodes, is_target):
+        self.names = list(nodes)
+        ids = {name: i for i, name in enumerate(self.names)}
+        self.successors = ([ids[left] for left, _ in nodes.values()], [ids[right] for _, right in nodes.values()])
+        self.instructions = [route == "R" for route in route_map]
+        self.targets = bytearray(is_target(name) for name in self.names)
+        self.ends, self.hits = self.compile_passes()
+        # jumps[k][node] is where 2^k passes from `node` end.
+        self.jumps = [self.ends]
+
+    def compile_passes(self):
+        ends, hits = [], []
+        for node in range(len(self.names)):
+            node_hits = []
+            for step, instruction in enumerate(self.instructions, start=1):
+                node = self.successors[instruction][node]
+                if self.targets[node]:
+                    node_hits.append(step)
+            ends.append(node)
+            hits.append(node_hits)
+        return ends, hits
+
+    def advance(self, name, passes):
+        """Returns the node reached after `passes` full passes, in O(log passes) jumps."""
+        node, level = self.names.index(name), 0
+        while passes:
+            if level == len(self.jumps):
+                previous = self.jumps[-1]
+                self.jumps.append([previous[next_node] for next_node in previous])
+            if passes & 1:
+                node = self.jumps[level][node]
+            passes, level = passes >> 1, level + 1
+        return self.names[node]
+
+    def analyse(self, name):
+        """Follows a walk pass by pass until a pass start repeats."""
+        seen, trail, node = {}, [], self.names.index(name)
+        while node not in seen:
+            seen[node] = len(trail)
+            trail.append(node)
+            node = self.ends[node]
+
+        length = len(self.instructions)
+        offset = seen[node] * length
+        period = (len(trail) - seen[node]) * length
+        hits = [i * length + step for i, pass_start in enumerate(trail) for step in self.hits[pass_start]]
+        return Cycle(offset, period, [hit for hit in hits if hit < offset], [hit for hit in hits if hit >= offset])
+
+    @staticmethod
+    def is_hit(cycle, step):
+        if step < cycle.offset:
+            return step in cycle.hits
+        return (step - cycle.offset) % cycle.period + cycle.offset in cycle.cycle_hits
+
+    @staticmethod
+    def first_common_hit(cycles):
+        """Returns the first step at which every walk stands on a target, or None."""
+        # Before the last walk enters its cycle, only its one-off hits can be shared.
+        latest = max(cycles, key=lambda cycle: cycle.offset)
+        for step in latest.hits:
+            if all(Network.is_hit(cycle, step) for cycle in cycles):
+                return step
+
+        # After it, every walk repeats, so its hits are congruences modulo its period.
+        # Walks are merged one by one, keeping every distinct residue that fits so far.
+        residues, modulus = {0}, 1
+        for cycle in cycles:
+            merged = set()
+            for residue in residues:
+                for hit in cycle.cycle_hits:
+                    step, combined = Network.crt(residue, modulus, hit, cycle.period)
+                    if combined is not None:
+                        merged.add(step)
+            residues, modulus = merged, modulus // gcd(modulus, cycle.period) * cycle.period
+
+        if not residues:
+            return None
+        return min(residue + (latest.offset - residue + modulus - 1) // modulus * modulus for residue in residues)
+
+    @staticmethod
+    def crt(r1, m1, r2, m2):
+        """Merges `x = r1 (mod m1)` and `x = r2 (mod m2)`, the moduli need not be coprime."""
+        divisor = gcd(m1, m2)
+        if (r2 - r1) % divisor:
+            return None, None
+        modulus = m1 // divisor * m2
+        k = (r2 - r1) // divisor * pow(m1 // divisor, -1, m2 // divisor) % (m2 // divisor)
+        return (r1 + m1 * k) % modulus, modulus
+
+
 class Solution:
-    def __init__(self, debug = False):
-        route_map, lines = open("input.txt", "r").read().strip().split("\n\n")
-        lines_list = lines.split("\n")
-        self.route_map = [x for x in route_map]
-        self.nodes = self.build_nodes(lines_list)
+    def __init__(self, input_file, debug=False):
+        self.route_map, self.nodes = parsed(input_file, self.parse)
         self.debug = debug
 
     def part_1(self):
-        counter, current_node = 0, "AAA"
-
-        while current_node != "ZZZ":
-            for route in self.route_map:
-                counter += 1
-                current_node = self.next_node(current_node, route)
-                if current_node == "ZZZ":
-                    break
-
-        return counter
+        network = Network(self.route_map, self.nodes, lambda node: node == "ZZZ")
+        return network.first_common_hit([network.analyse("AAA")])
 
     def part_2(self):
-        steps, starting_nodes = [], [x for x in self.nodes if x.endswith("A")]
+        network = Network(self.route_map, self.nodes, lambda node: node.endswith("Z"))
+        cycles = [network.analyse(node) for node in self.nodes if node.endswith("A")]
 
-        for node in starting_nodes:
-            node_route, counter, current_node = [], 0, node
+        if self.debug:
+            for cycle in cycles:
+                print(cycle)
 
-            while current_node.endswith("Z") is False:
-                for route in self.route_map:
-                    node_route.append((route, current_node))
-                    counter += 1
-                    current_node = self.next_node(current_node, route)
-                    if current_node.endswith("Z"):
-                        break
+        return network.first_common_hit(cycles)
 
-            steps.append(counter)
-            if self.debug:
-                print("For node: ", node, "route: ", node_route)
-
-        # That works only because each starting node falls into a cycle of constant length
-        return lcm(*steps)
 
+    @staticmethod
+    def parse(input_file):
+        (route_map,), lines_list = blocks(input_file)
+        return [x for x in route_map], Solution.build_nodes(lines_list)
 
     @staticmethod
     def build_nodes(lines_list: list[str]) -> dict[str, list[str]]:
@@ -50,12 +142,8 @@ class Solution:
             nodes[node] = re.findall(r"\w+", values)
         return nodes
 
-    def next_node(self, node: str, route: str) -> str:
-        if route == "L":
-            return self.nodes[node][0]
-        else:
-            return self.nodes[node][1]
-
 
-print("Solution one: ", Solution().part_1())
-print("Solution two: ", Solution().part_2())
+if __name__ == "__main__":
+    input_file = Path(__file__).with_name("input.txt")
+    print("Solution one: ", Solution(input_file).part_1())
+    print("Solution two: ", Solution(input_file).part_2())
@@ -1,47 +1,76 @@
 import re
+from collections import defaultdict
+from functools import cache
 from math import comb
+from pathlib import Path
+
+from aoc.inputs import lines
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
 class Solution:
-    def __init__(self, debug = False):
-        self.history = open("input.txt", "r").read().strip().split("\n")
+    def __init__(self, input_file, debug=False):
+        self.input_file = input_file
         self.nre = re.compile(r'(-?\d+)')
         self.debug = debug
 
     def part_1(self):
-        solution = 0
-        for line in self.history:
-            y_values = [int(x) for x in self.nre.findall(line)]
-            x_values = [i for i, x in enumerate(y_values)]
-            x = max(x_values) + 1
+        return sum(self.extrapolate(history)[0] for history in self.histories())
 
-            solution += self.lagrange_interpolation(x_values, y_values, x)
+    def part_2(self):
+        return sum(self.extrapolate(history)[1] for history in self.histories())
 
-        return round(solution)
+    def histories(self):
+        for line in lines(self.input_file):
+            yield [int(x) for x in self.nre.findall(line)]
 
-    def part_2(self):
-        solution = 0
-        for line in self.history:
-            y_values = [int(x) for x in self.nre.findall(line)]
-            x_values = [i for i, x in enumerate(y_values)]
-            solution += self.lagrange_interpolation(x_values, y_values, -1)
+    @staticmethod
+    @cache
+    def weights(length):
+        """Binomial weights extrapolating `length` values one step forward and one back.
 
-        return round(solution)
+        A history of n values is a polynomial of degree below n, so its n-th
+        finite difference is zero. Solved for the value after or before the
+        history, that gives an exact dot product with the history itself.
+        """
+        forward = tuple((-1) ** (length - 1 - i) * comb(length, i) for i in range(length))
+        backward = tuple((-1) ** i * comb(length, i + 1) for i in range(length))
+        return forward, backward
 
     @staticmethod
-    def lagrange_interpolation(x_values, y_values, x):
-        y = 0
-        n = len(y_values)
-
-        for i in range(n):
-            xi, yi = x_values[i], y_values[i]
-            term = yi
-            for j in range(n):
-                if i == j:
-                    continue
-
-                xj = x_values[j]
-                term *= (x - xj) / (xi - xj)
-            y += term
-        return y
-
-print("Solution one: ", Solution().part_1())
-print("Solution two: ", Solution().part_2())
\ No newline at end of file
+    def extrapolate(history):
+        forward, backward = Solution.weights(len(history))
+        return sum(map(int.__mul__, forward, history)), sum(map(int.__mul__, backward, history))
+
+    @staticmethod
+    def extrapolate_many(histories):
+        """Extrapolates histories in bulk, as one matrix product per length when NumPy is available.
+
+        Every history is held in memory at once, the parts stream them one by
+        one with `extrapolate` instead.
+        """
+        if np is None:
+            return [Solution.extrapolate(history) for history in histories]
+
+        by_length = defaultdict(list)
+        for index, history in enumerate(histories):
+            by_length[len(history)].append((index, history))
+
+        results = [None] * sum(map(len, by_length.values()))
+        for length, group in by_length.items():
+            indices, matrix = zip(*group)
+            # Object arrays keep Python ints, so large values stay exact.
+            weights = np.array(Solution.weights(length), dtype=object).T
+            for index, row in zip(indices, np.array(matrix, dtype=object) @ weights):
+                results[index] = tuple(row)
+        return results
+
+
+if __name__ == "__main__":
+    input_file = Path(__file__).with_name("input.txt")
+    print("Solution one: ", Solution(input_file).part_1())
+    print("Solution two: ", Solution(input_file).part_2())
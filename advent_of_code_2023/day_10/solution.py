@@ -1,5 +1,7 @@
-from collections import defaultdict
-from collections import deque as Queue
+from pathlib import Path
+
+from aoc import instrument
+from aoc.grid import Grid
 
 class Solution:
     # x, y are reversed in the matrix
@@ -9,6 +11,7 @@ class Solution:
         'left': (-1, 0),
         'right': (1, 0),
     }
+    OPPOSITE = {'up': 'down', 'down': 'up', 'left': 'right', 'right': 'left'}
     SYMBOLS = {
         '|': ('up', 'down'),
         '-': ('left', 'right'),
@@ -21,45 +24,81 @@ class Solution:
         '.': ()
     }
 
-    def __init__(self):
-        lines = open("input.txt", "r").read().strip().split("\n")
-        self.grid = self.build_grid(lines)
-        self.graph = self.build_graph(lines)
-        self.start = self.get_start()
+    def __init__(self, input_file):
+        self.grid = Grid.from_file(input_file)
+        self.start = self.grid.find('S')
+        self.loop = None
 
     def part_one(self):
-        visited = []
-        self.bfs_traverse(visited, [])
-        return len(visited) // 2
-
-    def part_two(self):
-        visited = []
-        self.bfs_traverse(visited, [])
-        return self.count_inside(visited)
+        return len(self.trace()) // 2
+
+    def part_two(self, scanline=False):
+        if scanline:
+            return self.count_inside(self.trace())
+        return self.count_enclosed(self.trace())
+
+    def trace(self):
+        """Returns the tiles of the loop in walking order, walking it only once."""
+        if self.loop is None:
+            self.loop = self.walk_loop()
+            instrument.count("loop tiles", len(self.loop))
+        return self.loop
+
+    def walk_loop(self):
+        (x, y), direction = self.start, self.start_directions()[0]
+        loop = [self.start]
+
+        while True:
+            (dx, dy) = Solution.MOVEMENTS[direction]
+            x, y = x + dx, y + dy
+            if (x, y) == self.start:
+                return loop
+
+            loop.append((x, y))
+            came_from = Solution.OPPOSITE[direction]
+            direction = next(dir for dir in Solution.SYMBOLS[self.grid[x, y]] if dir != came_from)
+
+    def start_directions(self):
+        """Directions from the start towards pipes connecting back to it."""
+        x, y = self.start
+        directions = []
+        for dir in Solution.SYMBOLS['S']:
+            (dx, dy) = Solution.MOVEMENTS[dir]
+            if self.grid.in_bounds(x + dx, y + dy) and Solution.OPPOSITE[dir] in Solution.SYMBOLS[self.grid[x + dx, y + dy]]:
+                directions.append(dir)
+        return directions
+
+    def start_symbol(self):
+        directions = set(self.start_directions())
+        return next(char for char, dirs in Solution.SYMBOLS.items() if set(dirs) == directions)
 
+    @staticmethod
+    def count_enclosed(loop):
+        # Shoelace formula gives the area within the loop tile centres, and Pick's
+        # theorem turns it into the tiles strictly inside: A = I + B / 2 - 1.
+        twice_area = 0
+        for (x1, y1), (x2, y2) in zip(loop, loop[1:] + loop[:1]):
+            twice_area += x1 * y2 - x2 * y1
 
-    def bfs_traverse(self, visited, queue):
-        queue.append(self.start)
-        visited.append(self.start)
+        return (abs(twice_area) - len(loop)) // 2 + 1
 
-        while queue:
-            node = queue.pop(0)
-            for neighbour in self.graph[node]:
-                if neighbour not in visited and self.grid[neighbour] != '.':
-                    visited.append(neighbour)
-                    queue.append(neighbour)
+    def count_inside(self, loop):
+        mask = bytearray(len(self.grid.data))
+        for x, y in loop:
+            mask[self.grid.index(x, y)] = 1
 
-    def count_inside(self, visited):
-        max_x, max_y = max(x for (x, y) in self.grid), max(y for (x, y) in self.grid)
+        start_symbol = self.start_symbol()
         counter = 0
 
-        for y in range(max_y + 1):
+        for y in range(self.grid.height):
             inside = False
             corner = None
-            for x, c in [(x, self.grid[x, y]) for x in range(max_x + 1)]:
-                if (x, y) in visited:
+            for x, c in enumerate(self.grid.row(y).decode()):
+                if mask[self.grid.index(x, y)]:
+                    if c == 'S':
+                        c = start_symbol
                     # Vertical bound is changing the `in` line state.
-                    #  S---
+                    #  |---
                     #  ||
                     if self.vertical_bound(c):
                         inside = not inside
@@ -68,13 +107,13 @@ class Solution:
                     elif self.opposite_corner(corner, c):
                         inside = not inside
                 else:
-                    # We add only ones that are not visited.
+                    # We add only ones that are not on the loop.
                     counter += inside
         return counter
 
     @staticmethod
     def vertical_bound(char):
-        return char == '|' or char == 'S'
+        return char == '|'
 
     @staticmethod
     def left_corner(char):
@@ -85,31 +124,7 @@ class Solution:
         return (line_corner == "F" and char == "J") or (line_corner == "L" and char == "7")
 
 
-    @staticmethod
-    def build_grid(lines):
-        matrix = {}
-        for y, line in enumerate(lines):
-            for x, char in enumerate(list(line)):
-                matrix[x, y] = char
-        return matrix
-
-    @staticmethod
-    def build_graph(lines):
-        matrix = defaultdict(list)
-        for y, line in enumerate(lines):
-            for x, char in enumerate(list(line)):
-                movements = Solution.SYMBOLS[char]
-                for dir in movements:
-                    (dx, dy) = Solution.MOVEMENTS[dir]
-                    if x + dx >= 0 and y + dy >= 0:
-                        matrix[x, y].append((x + dx, y + dy))
-        return matrix
-
-
-    def get_start(self):
-        for key, value in self.grid.items():
-            if value == 'S':
-                return key
-
-print("Solution one: ", Solution().part_one())
-print("Solution two: ", Solution().part_two())
\ No newline at end of file
+if __name__ == "__main__":
+    input_file = Path(__file__).with_name("input.txt")
+    print("Solution one: ", Solution(input_file).part_one())
+    print("Solution two: ", Solution(input_file).part_two())
@@ -1,93 +1,71 @@
-import itertools
-from collections import defaultdict
+from pathlib import Path
+
+from aoc.grid import Grid
+
 class Solution:
-    def __init__(self):
-        lines = open("input.txt", "r").read().strip().split("\n")
-        self.grid = self.build_grid(lines)
-        self.expanded_cols = []
-        self.expanded_rows = []
+    def __init__(self, input_file):
+        self.grid = Grid.from_file(input_file)
         self.debug = False
 
     def part_one(self):
-        counter = 0
-        self.expand_universe()
-        pairs = self.find_pairs(2)
-
-        for pair in pairs:
-            distance = self.get_distance(pair[0], pair[1])
-            counter += distance
-
-        return counter
+        return self.distance_sum(2)
 
     def part_two(self):
-        counter = 0
-        self.expand_universe()
-        pairs = self.find_pairs(1_000_000)
-
-        for pair in pairs:
-            distance = self.get_distance(pair[0], pair[1])
-            counter += distance
+        return self.distance_sum(1_000_000)
 
-        return counter
+    def distance_sum(self, expansion_factor):
+        return self.distance_sums([expansion_factor])[0]
 
-    @staticmethod
-    def get_distance(start, end):
-        (x1, y1), (x2, y2) = start, end
-        xdiff = abs(x2 - x1)
-        ydiff = abs(y2 - y1)
-        return xdiff + ydiff
+    def distance_sums(self, expansion_factors):
+        """Sums of distances between all pairs of galaxies, for every expansion factor.
 
-    def find_pairs(self, expansion_factor):
-        pairs = []
-        points = []
+        An expanded coordinate is `x + (factor - 1) * empty_before(x)` and both
+        terms grow with x, so every pair distance, and their sum, is affine in
+        the factor. Two sums computed once answer any number of factors.
+        """
+        base, per_expansion = self.distance_terms()
+        return [base + (factor - 1) * per_expansion for factor in expansion_factors]
 
-        for y, row in enumerate(self.grid):
-            for x, char in enumerate(row):
-                if char != ".":
-                    expanded_cols = [i for i in self.expanded_cols if i < x]
-                    expanded_rows = [i for i in self.expanded_rows if i < y]
-                    new_x = x + (len(expanded_cols) * (expansion_factor - 1)) if x > 0 else x
-                    new_y = y + (len(expanded_rows) * (expansion_factor - 1)) if y > 0 else y
-                    points.append((new_x, new_y))
+    def distance_terms(self):
+        galaxies = list(self.grid.find_all("#"))
+        xs = [x for x, _ in galaxies]
+        ys = [y for _, y in galaxies]
+        empty_cols = self.empty_before(xs, self.grid.width)
+        empty_rows = self.empty_before(ys, self.grid.height)
 
-        for point_a, point_b in itertools.combinations(points, 2):
-            pairs.append((point_a, point_b))
+        base = self.pairwise_sum(xs) + self.pairwise_sum(ys)
+        per_expansion = self.pairwise_sum([empty_cols[x] for x in xs]) + self.pairwise_sum([empty_rows[y] for y in ys])
+        return base, per_expansion
 
-        return pairs
-
-    def expand_universe(self):
-        row_length = len(self.grid[0])
-        column_length = len(self.grid)
-
-        for i in range(column_length):
-            valid_row = True
-            for j in range(row_length):
-                if self.grid[i][j] != ".":
-                    valid_row = False
-                    break
-            if valid_row:
-                self.expanded_rows.append(i)
+    @staticmethod
+    def empty_before(coordinates, size):
+        """Counts of empty rows (or columns) before every index."""
+        occupied = bytearray(size)
+        for coordinate in coordinates:
+            occupied[coordinate] = 1
+
+        counts, empty = [], 0
+        for index in range(size):
+            counts.append(empty)
+            empty += not occupied[index]
+        return counts
 
-        for j in range(row_length):
-            valid_col = True
-            for i in range(column_length):
-                if self.grid[i][j] != ".":
-                    valid_col = False
-                    break
-            if valid_col:
-                self.expanded_cols.append(j)
+    @staticmethod
+    def pairwise_sum(values):
+        # Once sorted, the k-th value is the larger one in its pairs with the k before it.
+        total, prefix = 0, 0
+        for k, value in enumerate(sorted(values)):
+            total += value * k - prefix
+            prefix += value
+        return total
 
     @staticmethod
     def print_grid(grid):
-        for row in grid:
-            print("".join(row))
+        for row in grid.rows():
+            print(row.decode())
 
-    @staticmethod
-    def build_grid(lines):
-        grid = []
-        for line in lines:
-            grid.append(list(line))
-        return grid
 
-print("Solution one:", Solution().part_one())
-print("Solution two:", Solution().part_two())
\ No newline at end of file
+if __name__ == "__main__":
+    input_file = Path(__file__).with_name("input.txt")
+    print("Solution one:", Solution(input_file).part_one())
+    print("Solution two:", Solution(input_file).part_two())
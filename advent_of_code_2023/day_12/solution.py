@@ -1,71 +1,86 @@
-from functools import cache
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from aoc import instrument
+from aoc.inputs import lines
 
 class Solution:
-    def __init__(self):
-        lines = open("input.txt", "r").read().strip().split("\n")
-        self.springs = self.get_springs(lines)
+    def __init__(self, input_file):
+        self.springs = self.get_springs(lines(input_file))
 
 
     def part_one(self):
         combinations = 0
-        for i, (springs, digits) in enumerate(self.springs):
-            result = self.get_combinations(springs, digits[:])
-            combinations += result
+        for springs, digits in self.springs:
+            combinations += self.get_combinations(springs, digits)
 
         return combinations
 
-    # Full @cache solution stolen from good soul on reddit
-    def part_two(self):
-        combinations = 0
-        for i, (springs, digits) in enumerate(self.springs):
-            print("Processing spring {}".format(i))
-            new_springs, new_digits = self.unfold_spring(springs[:], digits[:])
-            result = self.get_combinations(new_springs, new_digits[:])
-            combinations += result
+    def part_two(self, unfold=5, workers=None):
+        rows = [self.unfold_spring(springs, digits, unfold) for springs, digits in self.springs]
+        if not workers:
+            return sum(self.get_combinations(springs, digits) for springs, digits in rows)
 
-        return combinations
+        with ProcessPoolExecutor(workers) as executor:
+            chunksize = max(1, len(rows) // (4 * workers))
+            return sum(executor.map(Solution.get_combinations, *zip(*rows), chunksize=chunksize))
 
-    @cache
-    def get_combinations(self, spring, digits):
-        # End recursion
-        if len(spring) == 0 and len(digits) == 0:
-            return 1
-        elif len(spring) == 0:
+    @staticmethod
+    def get_combinations(spring, digits):
+        """Counts arrangements with a DP over (position, group) indices.
+
+        `ways[i]` is the number of ways to fit the groups placed so far into
+        `spring[:i]`. Group `j` can only end between the room taken by the groups
+        before it and the room needed by the ones after it, so only that window
+        is computed, and two rows are swapped between groups.
+        """
+        length = len(spring)
+        if sum(digits) + len(digits) - 1 > length:
             return 0
 
-        cursor = spring[0]
-        if cursor == "#":
-            # This one is invalid as cursor is # and we have no digits left to assign it
-            if len(digits) == 0 or len(spring) < digits[0]:
-                return 0
-            # This one is invalid as there is a "." splitting the group
-            elif "." in spring[0:digits[0]]:
-                return 0
-            # This one is invalid as there is a "#" just after the group
-            elif len(spring[digits[0]:]) > 0 and spring[digits[0]:][0] == '#':
-                return 0
-            # This one is invalid as there is too many # in the group
-            elif len(spring) > digits[0] and spring[0:digits[0] - 1].count("#") > digits[0]:
-                return 0
-            elif len(spring) > digits[0]:
-                # This one may be valid, we can drop the cursor and continue
-                if spring[digits[0]] == "?":
-                    return self.get_combinations(spring[digits[0] + 1:].lstrip("."), digits[1:])
-
-
-            return self.get_combinations(spring[digits[0]:].lstrip("."), digits[1:])
-        # We can drop the cursor and following . and continue as group
-        elif cursor == ".":
-            return self.get_combinations(spring[:].lstrip("."), digits[:])
-        elif cursor == "?":
-            r1 = self.get_combinations('#' + spring[1:], digits[:])
-            r2 = self.get_combinations('.' + spring[1:], digits[:])
-            return r1 + r2
+        dots = [0] * (length + 1)
+        for i, char in enumerate(spring):
+            dots[i + 1] = dots[i] + (char == ".")
+
+        ways, next_ways = [0] * (length + 1), [0] * (length + 1)
+        # Before any group, a prefix is valid as long as there is no "#" in it.
+        ways[0] = 1
+        for i, char in enumerate(spring):
+            if char == "#":
+                break
+            ways[i + 1] = 1
+
+        start, needed, cells = 0, sum(digits) + len(digits), 0
+        for size in digits:
+            needed -= size + 1
+            first_end, last_end = start + size, length - needed
+            cells += last_end - first_end + 1
+            next_ways[first_end - 1] = 0
+
+            for end in range(first_end, last_end + 1):
+                # Either the group ended earlier and this cell is "."
+                total = next_ways[end - 1] if spring[end - 1] != "#" else 0
+                # or the group ends here, with no "." in it and no "#" just before it.
+                begin = end - size
+                if dots[end] == dots[begin]:
+                    if begin == 0:
+                        total += ways[0]
+                    elif spring[begin - 1] != "#":
+                        total += ways[begin - 1]
+                next_ways[end] = total
+
+            ways, next_ways = next_ways, ways
+            start = first_end + 1
+
+        instrument.count("dp rows")
+        instrument.count("dp cells", cells)
+        return ways[length]
 
     @staticmethod
-    def unfold_spring(spring, digits):
-        digits = digits * 5
-        spring = "?".join([spring for i in range(5)])
+    def unfold_spring(spring, digits, factor=5):
+        digits = digits * factor
+        spring = "?".join([spring for i in range(factor)])
 
         return spring, digits
 
@@ -78,5 +93,13 @@ class Solution:
             result.append((springs, digits))
         return result
 
-print("Solution one: ", Solution().part_one())
-print("Solution two: ", Solution().part_two())
\ No newline at end of file
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("input_file", nargs="?", default=Path(__file__).with_name("input.txt"))
+    parser.add_argument("--unfold", type=int, default=5, help="unfold factor for part two")
+    parser.add_argument("--workers", type=int, help="count rows over a process pool of this size")
+    args = parser.parse_args()
+
+    print("Solution one: ", Solution(args.input_file).part_one())
+    print("Solution two: ", Solution(args.input_file).part_two(args.unfold, args.workers))
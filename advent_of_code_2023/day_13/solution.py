@@ -0,0 +1,54 @@
+from pathlib import Path
+
+from aoc.inputs import blocks
+
+
+class Solution:
+    BITS = str.maketrans("#.", "10")
+
+    def __init__(self, input_file):
+        self.__input_file = input_file
+
+    def part_one(self):
+        return self.summarize(0)
+
+    def part_two(self):
+        return self.summarize(1)
+
+    def summarize(self, smudges):
+        """Patterns are read one block at a time, so only one is ever in memory."""
+        total = 0
+        for pattern in blocks(self.__input_file):
+            rows, columns = self.masks(pattern)
+            total += 100 * self.reflection(rows, smudges) or self.reflection(columns, smudges)
+        return total
+
+    @classmethod
+    def masks(cls, pattern):
+        """Every row and every column as an int, with a bit set for every "#"."""
+        rows = [int(line.translate(cls.BITS), 2) for line in pattern]
+        columns = [int("".join(column).translate(cls.BITS), 2) for column in zip(*pattern)]
+        return rows, columns
+
+    @staticmethod
+    def reflection(masks, smudges=0):
+        """Returns how many masks lie before the mirror line, or 0 if there is none.
+
+        A line mirrors the masks when the pairs around it differ in exactly
+        `smudges` bits in total, so part one asks for 0 and part two for 1.
+        """
+        for line in range(1, len(masks)):
+            difference = 0
+            for offset in range(min(line, len(masks) - line)):
+                difference += (masks[line - 1 - offset] ^ masks[line + offset]).bit_count()
+                if difference > smudges:
+                    break
+            if difference == smudges:
+                return line
+        return 0
+
+
+if __name__ == "__main__":
+    input_file = Path(__file__).with_name("input.txt")
+    print("Solution one: ", Solution(input_file).part_one())
+    print("Solution two: ", Solution(input_file).part_two())
@@ -1,97 +1,84 @@
-import re
-from collections import defaultdict
-class Solution:
-    def __init__(self):
-        self.__input = open("input.txt", "r").read().strip().split(",")
-        self.__regexp = re.compile(r"([a-zA-z]*)([-=]\d*)")
+from functools import lru_cache
+from pathlib import Path
 
-    def part_one(self):
-        solution = 0
-        for letters in self.__input:
-            current_value = self.decode_string(letters)
-            solution += current_value
+from aoc.inputs import tokens
 
-        return solution
 
-    def part_two(self):
-        power = 0
-        boxes = defaultdict(list)
-        for letters in self.__input:
-            box_label, operation = self.find_box_label_and_operation(letters)
-            box_number = self.decode_string(box_label)
-            self.apply_operation(boxes, box_number, box_label, operation)
+class Solution:
+    # HASH step for every (current value, byte) pair, indexed by `value << 8 | byte`.
+    HASH_TABLE = bytes((value + byte) * 17 % 256 for value in range(256) for byte in range(256))
+    COMMA = ord(",")
+    # Dropped from the steps like `tokens` strips them, so CRLF inputs hash the same.
+    WHITESPACE = b" \t\n\r\v\f"
 
-        for box_number, entries in boxes.items():
-            box_power = self.calculate_box_power(box_number, entries)
-            power += box_power
+    def __init__(self, input_file):
+        self.__input_file = input_file
 
-        return power
+    def part_one(self):
+        return self.hash_sum(self.__input_file)
 
-    def find_box_label_and_operation(self, letters):
-        group = re.search(self.__regexp, letters)
-        label = group.group(1)
-        operation = group.group(2)
-        return label, operation
+    def part_two(self):
+        # Dicts keep insertion order and keep it on update, which is exactly a lens box.
+        boxes = [{} for _ in range(256)]
+        for letters in tokens(self.__input_file):
+            self.apply_operation(boxes, letters)
+
+        return sum(self.calculate_box_power(box_number, box) for box_number, box in enumerate(boxes))
+
+    @classmethod
+    def hash_sum(cls, input_file, chunk_size=1 << 16):
+        """Sums the HASH of every step, folding raw bytes through the lookup table."""
+        table, comma, whitespace = cls.HASH_TABLE, cls.COMMA, cls.WHITESPACE
+        solution, current_value = 0, 0
+
+        with open(input_file, "rb") as file:
+            for chunk in iter(lambda: file.read(chunk_size), b""):
+                for byte in chunk.translate(None, whitespace):
+                    if byte == comma:
+                        solution += current_value
+                        current_value = 0
+                    else:
+                        current_value = table[current_value << 8 | byte]
+
+        return solution + current_value
 
     @staticmethod
+    # Bounded, so streams of distinct labels don't grow the memo for the life of the process.
+    @lru_cache(maxsize=1 << 16)
     def decode_string(letters):
         current_value = 0
-        for letter in list(letters):
-            current_value += ord(letter)
-            current_value *= 17
-            current_value %= 256
+        for letter in letters.encode():
+            current_value = Solution.HASH_TABLE[current_value << 8 | letter]
 
         return current_value
 
-    def apply_operation(self, boxes, box_number, box_label, operation):
-        if operation.startswith("="):
-            self.add_to_box(boxes, box_number, box_label, operation)
-        elif operation.startswith("-"):
-            self.remove_from_box(boxes, box_number, box_label)
-        else:
-            raise ValueError("Operation not supported: ", operation)
-
-    def add_to_box(self, boxes, box_number, box_label, operation):
-        value = int(re.findall(r"\d+", operation)[0])
-        index = self.find_index(boxes[box_number], box_label)
-        if index is None:
-            boxes[box_number].append((box_label, value))
+    def apply_operation(self, boxes, letters):
+        if letters.endswith("-"):
+            self.remove_from_box(boxes, letters[:-1])
+        elif "=" in letters:
+            box_label, _, value = letters.partition("=")
+            self.add_to_box(boxes, box_label, int(value))
         else:
-            boxes[box_number][index] = (box_label, value)
+            raise ValueError("Operation not supported: ", letters)
 
-    def remove_from_box(self, boxes, box_number, box_label):
-        current_entries = boxes[box_number]
-        new_entries = self.filter_entries(current_entries[:], box_label)
-        boxes[box_number] = new_entries
+    def add_to_box(self, boxes, box_label, value):
+        boxes[self.decode_string(box_label)][box_label] = value
 
-    @staticmethod
-    def filter_entries(entries, box_label):
-        return [entry for entry in entries if not entry[0] == box_label]
-
-    @staticmethod
-    def find_index(entries, box_label):
-        for index, entry in enumerate(entries):
-            if entry[0] == box_label:
-                return index
-
-        return None
+    def remove_from_box(self, boxes, box_label):
+        boxes[self.decode_string(box_label)].pop(box_label, None)
 
     @staticmethod
-    def calculate_box_power(box_number, entries):
-        if len(entries) == 0:
-            return 0
-
+    def calculate_box_power(box_number, box):
         box_power = 0
         box_base = box_number + 1
-        for idx, entry in enumerate(entries):
-            entry_power = box_base * (idx + 1) * entry[1]
+        for idx, focal_length in enumerate(box.values()):
+            entry_power = box_base * (idx + 1) * focal_length
             box_power += entry_power
 
         return box_power
 
 
-
-
-
-print("Solution one: ", Solution().part_one())
-print("Solution two: ", Solution().part_two())
\ No newline at end of file
+if __name__ == "__main__":
+    input_file = Path(__file__).with_name("input.txt")
+    print("Solution one: ", Solution(input_file).part_one())
+    print("Solution two: ", Solution(input_file).part_two())
@@ -1,111 +1,336 @@
-import time
+import argparse
+import os
+from array import array
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from aoc import instrument
+from aoc.grid import Grid
+
+
+class BeamGraph:
+    """Beam paths compressed into segments running from splitter to splitter.
+
+    Between two splitters a beam is deterministic, so every splitter becomes a
+    node with two outgoing segments. Energised cells are int bitsets (one bit
+    per grid index) built for every strongly connected component of that
+    graph, sinks first, so on top of one pass over the graph an entry point
+    costs one segment walk and a single union. Entry points are answered in a
+    batch, as soon as the component they end on is built, and a bitset is
+    dropped once every component pointing at it is, so only the bitsets still
+    needed are held at any time.
+    """
+    # Directions are up, right, down, left.
+    DX = (0, 1, 0, -1)
+    DY = (-1, 0, 1, 0)
+    SLASH = (1, 0, 3, 2)
+    BACKSLASH = (3, 2, 1, 0)
+    # Directions that pass a splitter untouched, any other one is split in two.
+    SPLITTERS = {ord('|'): (0, 2), ord('-'): (1, 3)}
+
+    def __init__(self, grid):
+        self.grid = grid
+        self.splitters = self.build_splitters()
+        self.incoming = Counter(successor for _, successors in self.splitters.values() for successor in successors)
+        # Components of the current pass, their bitsets still needed and the
+        # edges from components not closed yet, all reset by `build_reach`.
+        self.component, self.reach, self.remaining = {}, {}, {}
+        instrument.count("beam graph splitters", len(self.splitters))
+
+    def max_energy(self):
+        return max(self.energies(self.entries()).values())
+
+    def energy(self, x, y, direction):
+        """Energy of a single entry point.
+
+        This is a whole pass over the graph, so batch entry points through
+        `energies` rather than calling this for each of them.
+        """
+        return self.energies([(x, y, direction)])[x, y, direction]
+
+    def energies(self, entries):
+        """Returns the energy of every entry point, in a single pass over the graph."""
+        results, waiting = {}, defaultdict(list)
+        for entry in entries:
+            cells, end = self.walk(*entry)
+            if end is None:
+                results[entry] = len(set(cells))
+            else:
+                waiting[end].append((entry, array("I", cells)))
+        self.build_reach(results, waiting)
+        return results
+
+    def entries(self):
+        width, height = self.grid.width, self.grid.height
+        for y in range(height):
+            yield 0, y, 1
+            yield width - 1, y, 3
+        for x in range(width):
+            yield x, 0, 2
+            yield x, height - 1, 0
+
+    def walk(self, x, y, direction):
+        """Follows a beam until it hits a splitter across or leaves the grid.
+
+        Returns the indices of the energised cells and the index of the
+        splitter the beam ended on, or None.
+        """
+        grid, data = self.grid, self.grid.data
+        start, cells = (x, y, direction), []
+
+        while 0 <= x < grid.width and 0 <= y < grid.height:
+            index = y * grid.stride + x
+            cells.append(index)
+            char = data[index]
+            if char in self.SPLITTERS:
+                if direction not in self.SPLITTERS[char]:
+                    return cells, index
+            elif char == 47:  # /
+                direction = self.SLASH[direction]
+            elif char == 92:  # \
+                direction = self.BACKSLASH[direction]
+
+            x, y = x + self.DX[direction], y + self.DY[direction]
+            # Moves are reversible, so a beam can only loop back to where it started.
+            if (x, y, direction) == start:
+                break
+
+        return cells, None
+
+    @staticmethod
+    def bitset(indices):
+        bits = bytearray((max(indices) >> 3) + 1)
+        for index in indices:
+            bits[index >> 3] |= 1 << (index & 7)
+        return int.from_bytes(bits, "little")
+
+    def build_splitters(self):
+        splitters = {}
+        for char in '|-':
+            for x, y in self.grid.find_all(char):
+                # Cell indices are kept packed, there are a few for every cell of the grid.
+                cells, successors = array("I", [self.grid.index(x, y)]), []
+                for direction in self.SPLITTERS[ord(char)]:
+                    segment, end = self.walk(x + self.DX[direction], y + self.DY[direction], direction)
+                    cells.extend(segment)
+                    if end is not None:
+                        successors.append(end)
+                splitters[self.grid.index(x, y)] = (cells, successors)
+        return splitters
+
+    def build_reach(self, results, waiting):
+        """Tarjan's algorithm over the splitter graph.
+
+        Components are completed sinks first, so the cells reachable from every
+        component they point to are already known when one is closed.
+        """
+        order, low, stack, on_stack = {}, {}, [], set()
+        for state in (self.component, self.reach, self.remaining):
+            state.clear()
+
+        # Beams mostly lead to splitters close by, so going from the bottom up
+        # the components pointing at a closed one tend to close soon after.
+        for root in sorted(self.splitters, reverse=True):
+            if root in order:
+                continue
+            order[root] = low[root] = len(order)
+            stack.append(root)
+            on_stack.add(root)
+            work = [(root, iter(self.splitters[root][1]))]
+
+            while work:
+                node, successors = work[-1]
+                for successor in successors:
+                    if successor not in order:
+                        order[successor] = low[successor] = len(order)
+                        stack.append(successor)
+                        on_stack.add(successor)
+                        work.append((successor, iter(self.splitters[successor][1])))
+                        break
+                    if successor in on_stack:
+                        low[node] = min(low[node], order[successor])
+                else:
+                    work.pop()
+                    if work:
+                        parent = work[-1][0]
+                        low[parent] = min(low[parent], low[node])
+                    if low[node] == order[node]:
+                        self.close_component(node, stack, on_stack, results, waiting)
+
+        instrument.count("beam graph components", len(self.remaining))
+
+    def close_component(self, node, stack, on_stack, results, waiting):
+        current, members = len(self.remaining), []
+        while not members or members[-1] != node:
+            member = stack.pop()
+            on_stack.discard(member)
+            self.component[member] = current
+            members.append(member)
+
+        cells = self.bitset([cell for member in members for cell in self.splitters[member][0]])
+        edges = [self.component[successor] for member in members for successor in self.splitters[member][1]]
+        for successor in set(edges) - {current}:
+            cells |= self.reach[successor]
+
+        for member in members:
+            for entry, segment in waiting.pop(member, ()):
+                results[entry] = (cells | self.bitset(segment)).bit_count()
+
+        # Edges from other components, each of them is closed later and releases one.
+        self.remaining[current] = sum(self.incoming[member] for member in members) - edges.count(current)
+        self.reach[current] = cells
+        self.release(current, 0)
+        for successor in edges:
+            if successor != current:
+                self.release(successor)
+
+    def release(self, component, edges=1):
+        self.remaining[component] -= edges
+        if not self.remaining[component]:
+            del self.reach[component]
+
+
+class Beams:
+    """Follows beams cell by cell over flat indices into a table of cell types.
+
+    The grid is padded with a wall column and a wall row, so a step off any
+    edge, including a negative index wrapping around to the end, lands on a
+    wall and no bounds checks are needed. Buffers are reused between calls.
+    """
+    EMPTY, SLASH, BACKSLASH, VERTICAL, HORIZONTAL, WALL = range(6)
+    # Outgoing directions for every cell type and incoming direction,
+    # directions are up, right, down, left.
+    TRANSITIONS = (
+        ((0,), (1,), (2,), (3,)),
+        ((1,), (0,), (3,), (2,)),
+        ((3,), (2,), (1,), (0,)),
+        ((0,), (0, 2), (2,), (0, 2)),
+        ((1, 3), (1,), (1, 3), (3,)),
+        ((), (), (), ()),
+    )
+    TYPE_TABLE = bytes.maketrans(b'./\\|-', bytes((EMPTY, SLASH, BACKSLASH, VERTICAL, HORIZONTAL)))
+
+    def __init__(self, grid):
+        self.stride = grid.width + 1
+        wall = bytes([self.WALL])
+        self.types = b"".join(row.translate(self.TYPE_TABLE) + wall for row in grid.rows()) + wall * self.stride
+        self.steps = (-self.stride, 1, self.stride, -1)
+        self.transitions = tuple(outgoing for cell in self.TRANSITIONS for outgoing in cell)
+        # Bit `direction` of a cell is set once a beam went through it that way.
+        self.visited = bytearray(len(self.types))
+        self.blank = bytes(len(self.types))
+        self.stack = []
+
+    def index(self, x, y):
+        return y * self.stride + x
+
+    def energize(self, x, y, direction):
+        """Returns the number of cells energised by a beam entering (x, y)."""
+        types, steps, transitions, visited, stack = self.types, self.steps, self.transitions, self.visited, self.stack
+        wall = self.WALL
+        visited[:] = self.blank
+        stack.append(self.index(x, y) << 2 | direction)
+
+        while stack:
+            move = stack.pop()
+            index, direction = move >> 2, move & 3
+            cell = types[index]
+            if cell == wall or visited[index] >> direction & 1:
+                continue
+            visited[index] |= 1 << direction
+            for outgoing in transitions[cell << 2 | direction]:
+                stack.append((index + steps[outgoing]) << 2 | outgoing)
+
+        if instrument.enabled():
+            # Every set direction bit is one step of a beam.
+            instrument.count("beam steps", int.from_bytes(visited, "little").bit_count())
+        return len(visited) - visited.count(0)
+
+
 class Solution:
-    MOVEMENTS = {
-        'up': (0, -1),
-        'down': (0, 1),
-        'left': (-1, 0),
-        'right': (1, 0)
-    }
+    DIRECTIONS = ('up', 'right', 'down', 'left')
+
     def __init__(self, input_file):
-        self.grid = self.build_grid(input_file)
-        self.visited = set()
-        self.visited_moves = set()
+        self.grid = Grid.from_file(input_file)
+        self.beams = Beams(self.grid)
 
     def part_one(self):
-        movements = [((0, 0), 'right')]
-        return self.traverse(movements)
-
+        return self.traverse(0, 0, 1)
 
     def part_two(self):
-        min_x = min([x for x, y in self.grid.keys()])
-        max_x = max([x for x, y in self.grid.keys()])
-        min_y = min([y for x, y in self.grid.keys()])
-        max_y = max([y for x, y in self.grid.keys()])
-
-        left = max(self.traverse([((min_x, y), 'right')]) for y in range(min_y, max_y + 1))
-        right = max(self.traverse([((max_x, y), 'left')]) for y in range(min_y, max_y + 1))
-        top = max(self.traverse([((x, min_y), 'down')]) for x in range(min_x, max_x + 1))
-        bottom = max(self.traverse([((x, max_y), 'up')]) for x in range(min_x, max_x + 1))
-
-        return max(top, bottom, left, right)
-
-
-    def traverse(self, movements):
-        self.cleanup()
-
-        while len(movements) > 0:
-            pos, direction = movements.pop()
-            self.visited_moves.add((pos, direction))
-            self.visited.add(pos)
-
-            if self.grid[pos] == '.':
-                self.move_beam(movements, pos, direction)
-            elif self.grid[pos] == '|':
-                if direction in ['up', 'down']:
-                    self.move_beam(movements, pos, direction)
-                elif direction in ['left', 'right']:
-                    self.move_beam(movements, pos, 'up')
-                    self.move_beam(movements, pos, 'down')
-            elif self.grid[pos] == '-':
-                if direction in ['left', 'right']:
-                    self.move_beam(movements, pos, direction)
-                elif direction in ['up', 'down']:
-                    self.move_beam(movements, pos, 'left')
-                    self.move_beam(movements, pos, 'right')
-            elif self.grid[pos] == '/':
-                if direction == 'right':
-                    self.move_beam(movements, pos, 'up')
-                elif direction == 'left':
-                    self.move_beam(movements, pos, 'down')
-                elif direction == 'up':
-                    self.move_beam(movements, pos, 'right')
-                elif direction == 'down':
-                    self.move_beam(movements, pos, 'left')
-            elif self.grid[pos] == '\\':
-                if direction == 'right':
-                    self.move_beam(movements, pos, 'down')
-                elif direction == 'left':
-                    self.move_beam(movements, pos, 'up')
-                elif direction == 'up':
-                    self.move_beam(movements, pos, 'left')
-                elif direction == 'down':
-                    self.move_beam(movements, pos, 'right')
-
-        return len(self.visited)
-
-    def move_beam(self, movements_queue, pos, direction):
-        next_pos = (pos[0] + self.MOVEMENTS[direction][0], pos[1] + self.MOVEMENTS[direction][1])
-        next_move = (next_pos, direction)
-        if next_pos in self.grid.keys() and next_move not in self.visited_moves:
-            movements_queue.append(next_move)
-
-    def cleanup(self):
-        self.visited = set()
-        self.visited_moves = set()
+        return BeamGraph(self.grid).max_energy()
+
+    def edge_scan(self, workers=None, energies=False):
+        """Traverses from every edge cell, fanned out over a process pool.
+
+        Returns the best energy, or the energy of every entry point when
+        `energies` is set.
+        """
+        entries = list(self.edges())
+        workers = workers or os.cpu_count()
+        # Workers receive the grid once at start-up instead of with every entry.
+        grid = Grid(bytes(self.grid.data), self.grid.width, self.grid.height, self.grid.stride)
+
+        with ProcessPoolExecutor(workers, initializer=init_worker, initargs=(grid,)) as executor:
+            chunksize = max(1, len(entries) // (4 * workers))
+            results = list(executor.map(entry_energy, entries, chunksize=chunksize))
+
+        if energies:
+            return dict(zip(entries, results))
+        return max(results)
+
+    def edges(self):
+        max_x, max_y = self.grid.width - 1, self.grid.height - 1
+        for y in range(max_y + 1):
+            yield 0, y, 1
+            yield max_x, y, 3
+        for x in range(max_x + 1):
+            yield x, 0, 2
+            yield x, max_y, 0
+
+    def traverse(self, x, y, direction):
+        return self.beams.energize(x, y, direction)
 
     def print_grid(self):
-        min_x = min([x for x, y in self.grid.keys()])
-        max_x = max([x for x, y in self.grid.keys()])
-        min_y = min([y for x, y in self.grid.keys()])
-        max_y = max([y for x, y in self.grid.keys()])
+        min_x, max_x = 0, self.grid.width - 1
+        min_y, max_y = 0, self.grid.height - 1
 
         for y in range(min_y, max_y + 1):
             for x in range(min_x, max_x + 1):
-                pos = (x, y)
-                if pos in self.visited:
+                if self.beams.visited[self.beams.index(x, y)]:
                     print('#', end='')
                 else:
                     print(self.grid[(x, y)], end='')
             print()
 
-    @staticmethod
-    def build_grid(input_file):
-        grid = {}
-        with open(input_file) as f:
-            for row_idx, line in enumerate(f):
-                for col_idx, char in enumerate(line.strip()):
-                    grid[(col_idx, row_idx)] = char
-        return grid
-
-print("Solution one: ", Solution("input.txt").part_one())
-print("Solution two: ", Solution("input.txt").part_two())
\ No newline at end of file
+
+# Beams shared with edge scan workers, set once per process by `init_worker`.
+worker_beams = None
+
+
+def init_worker(grid):
+    global worker_beams
+    worker_beams = Beams(grid)
+
+
+def entry_energy(entry):
+    return worker_beams.energize(*entry)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("input_file", nargs="?", default=Path(__file__).with_name("input.txt"))
+    parser.add_argument("--workers", type=int, help="scan every edge over a process pool of this size")
+    parser.add_argument("--energies", action="store_true", help="with --workers, print every entry point energy")
+    args = parser.parse_args()
+
+    print("Solution one: ", Solution(args.input_file).part_one())
+    if args.workers:
+        energies = Solution(args.input_file).edge_scan(args.workers, energies=True)
+        if args.energies:
+            for (x, y, direction), energy in energies.items():
+                print(x, y, Solution.DIRECTIONS[direction], energy)
+        print("Solution two: ", max(energies.values()))
+    else:
+        print("Solution two: ", Solution(args.input_file).part_two())